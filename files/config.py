@@ -11,46 +11,77 @@ Theme / global settings are stored in settings.json in the same base dir.
 
 import json
 import logging
+import mmap
 import os
 import platform
 import shutil
+import threading
+from dataclasses import asdict, dataclass, fields, replace
+from functools import lru_cache
 from pathlib import Path
 
+from presets import Key
+
+try:
+    import orjson            # optional — much faster parse/dump than stdlib json
+except ImportError:
+    orjson = None
+
 log = logging.getLogger("config")
 
 APP_NAME = "KeyboardOverlay"
 
-# ── Default theme ─────────────────────────────────────────────────────────────
-
-DEFAULT_THEME = {
-    "bg":              "#111111",
-    "key_idle":        "#2a2a3a",
-    "key_pressed":     "#7b68ee",
-    "mouse_idle":      "#1e3a5f",
-    "mouse_pressed":   "#1e90ff",
-    "key_text":        "#ffffff",
-    "key_outline":     "#444466",
-    "font_family":     "Consolas",
-    "font_size":       10,
-    "font_bold":       True,
-    "key_radius":      6,       # px — corner rounding
-    "key_unit_px":     44,      # px per 1u
-    "key_gap_px":      4,       # px gap between keys
-    "key_height_px":   44,
-    "overlay_alpha":   0.93,
-    "grid_size":       44,      # editor snap grid in px
-    "grid_visible":    True,
-    "snap_to_grid":    True,
-}
+# ── Theme ─────────────────────────────────────────────────────────────────────
+
+@dataclass(slots=True)
+class Theme:
+    """Overlay / editor appearance. Field defaults are the default theme;
+    stored in settings.json as a plain dict under "theme"."""
+    bg:              str   = "#111111"
+    key_idle:        str   = "#2a2a3a"
+    key_pressed:     str   = "#7b68ee"
+    mouse_idle:      str   = "#1e3a5f"
+    mouse_pressed:   str   = "#1e90ff"
+    key_text:        str   = "#ffffff"
+    key_outline:     str   = "#444466"
+    font_family:     str   = "Consolas"
+    font_size:       int   = 10
+    font_bold:       bool  = True
+    key_radius:      int   = 6       # px — corner rounding
+    key_unit_px:     int   = 44      # px per 1u
+    key_gap_px:      int   = 4       # px gap between keys
+    key_height_px:   int   = 44
+    overlay_alpha:   float = 0.93
+    grid_size:       int   = 44      # editor snap grid in px
+    grid_visible:    bool  = True
+    snap_to_grid:    bool  = True
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Theme":
+        """Unknown keys (e.g. from a newer version) are dropped, missing ones
+        take the default."""
+        return cls(**{k: d[k] for k in _THEME_FIELDS if k in d})
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def copy(self) -> "Theme":
+        return replace(self)
+
+
+_THEME_FIELDS = tuple(f.name for f in fields(Theme))
 
 DEFAULT_SETTINGS = {
-    "theme": DEFAULT_THEME,
     "last_config": None,
     "overlay_x": 100,
     "overlay_y": 100,
 }
 
 
+# Resolved (and created) once per process — every config operation goes
+# through these, so skip the platform lookup and mkdir on repeat calls.
+
+@lru_cache(maxsize=1)
 def get_app_dir() -> Path:
     system = platform.system()
     if system == "Windows":
@@ -65,41 +96,95 @@ def get_app_dir() -> Path:
     return p
 
 
+@lru_cache(maxsize=1)
 def get_configs_dir() -> Path:
     p = get_app_dir() / "configs"
     p.mkdir(parents=True, exist_ok=True)
     return p
 
 
+@lru_cache(maxsize=1)
 def get_settings_path() -> Path:
     return get_app_dir() / "settings.json"
 
 
+# ── JSON I/O ──────────────────────────────────────────────────────────────────
+
+_MMAP_THRESHOLD = 64 * 1024   # bytes — smaller files are cheaper to just read()
+
+
+def _read_json(path: Path):
+    with open(path, "rb") as f:
+        # orjson parses straight from a buffer, so big layouts can be mapped
+        # instead of copied into a bytes object first.
+        if orjson is not None and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for advice in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+                    if hasattr(mmap, advice):
+                        mm.madvise(getattr(mmap, advice))
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Saves may run on a worker thread; two writers sharing a .tmp file would
+# interleave, so all writes go through one lock.
+_write_lock = threading.Lock()
+
+
+def _write_json(path: Path, obj, pretty: bool = False):
+    """Write via a temp file + os.replace so a crash never leaves half a file.
+    Layout configs are machine-read and stored compact; pass pretty=True for
+    files people are expected to hand-edit."""
+    tmp = path.with_name(path.name + ".tmp")
+    with _write_lock:
+        if orjson is not None:
+            tmp.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0))
+        elif pretty:
+            tmp.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+        else:
+            tmp.write_text(json.dumps(obj, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+
 # ── Settings ──────────────────────────────────────────────────────────────────
 
+# The settings file / config listing are cached until this module changes
+# what is on disk — every mutating function below clears the relevant cache.
+
 def load_settings() -> dict:
+    """Settings as last saved. Each call gets its own dict and Theme, so the
+    caller can edit them without touching what later calls see."""
+    cached = _read_settings()
+    return dict(cached, theme=cached["theme"].copy())
+
+
+@lru_cache(maxsize=1)
+def _read_settings() -> dict:
     path = get_settings_path()
-    if path.exists():
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            # Merge missing keys from defaults
-            merged = dict(DEFAULT_SETTINGS)
-            merged.update(data)
-            merged["theme"] = dict(DEFAULT_THEME)
-            merged["theme"].update(data.get("theme", {}))
-            log.info("Settings loaded from %s", path)
-            return merged
-        except Exception as e:
-            log.error("Failed to load settings: %s — using defaults", e)
-    return dict(DEFAULT_SETTINGS)
+    try:
+        data = _read_json(path)
+        # Merge missing keys from defaults
+        merged = dict(DEFAULT_SETTINGS)
+        merged.update(data)
+        merged["theme"] = Theme.from_dict(data.get("theme", {}))
+        log.info("Settings loaded from %s", path)
+        return merged
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log.error("Failed to load settings: %s — using defaults", e)
+    return dict(DEFAULT_SETTINGS, theme=Theme())
 
 
 def save_settings(settings: dict):
     path = get_settings_path()
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=2)
+        _write_json(path, dict(settings, theme=settings["theme"].to_dict()), pretty=True)
+        _read_settings.cache_clear()
         log.info("Settings saved to %s", path)
     except Exception as e:
         log.error("Failed to save settings: %s", e)
@@ -108,34 +193,40 @@ def save_settings(settings: dict):
 # ── Layout configs ────────────────────────────────────────────────────────────
 
 def list_configs() -> list[str]:
-    """Return list of config names (no extension)."""
-    d = get_configs_dir()
-    names = sorted(p.stem for p in d.glob("*.json"))
+    """Return list of config names (no extension). A fresh list per call."""
+    return list(_scan_configs())
+
+
+@lru_cache(maxsize=1)
+def _scan_configs() -> tuple[str, ...]:
+    with os.scandir(get_configs_dir()) as it:
+        names = tuple(sorted(e.name[:-5] for e in it
+                             if e.name.endswith(".json") and e.is_file(follow_symlinks=False)))
     log.debug("Found %d configs: %s", len(names), names)
     return names
 
 
 def load_config(name: str) -> dict | None:
     path = get_configs_dir() / f"{name}.json"
-    if not path.exists():
-        log.warning("Config not found: %s", path)
-        return None
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json(path)
+        data["keys"] = [Key.from_dict(d) for d in data.get("keys", [])]
         log.info("Config loaded: %s (%d keys)", name, len(data.get("keys", [])))
         return data
+    except FileNotFoundError:
+        log.warning("Config not found: %s", path)
+        return None
     except Exception as e:
         log.error("Failed to load config '%s': %s", name, e)
         return None
 
 
 def save_config(name: str, config: dict) -> bool:
-    """Save a layout config. Returns True on success."""
+    """Save a layout config (keys as Key objects). Returns True on success."""
     path = get_configs_dir() / f"{name}.json"
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        _write_json(path, dict(config, keys=[k.to_dict() for k in config["keys"]]))
+        _scan_configs.cache_clear()
         log.info("Config saved: %s", path)
         return True
     except Exception as e:
@@ -147,6 +238,7 @@ def delete_config(name: str) -> bool:
     path = get_configs_dir() / f"{name}.json"
     try:
         path.unlink()
+        _scan_configs.cache_clear()
         log.info("Config deleted: %s", name)
         return True
     except Exception as e:
@@ -162,6 +254,7 @@ def rename_config(old: str, new: str) -> bool:
         return False
     try:
         src.rename(dst)
+        _scan_configs.cache_clear()
         log.info("Config renamed: %s → %s", old, new)
         return True
     except Exception as e:
@@ -177,6 +270,7 @@ def duplicate_config(name: str, new_name: str) -> bool:
         return False
     try:
         shutil.copy2(src, dst)
+        _scan_configs.cache_clear()
         log.info("Config duplicated: %s → %s", name, new_name)
         return True
     except Exception as e:
@@ -204,6 +298,7 @@ def import_config(src_path: str) -> str | None:
     dst = get_configs_dir() / src.name
     try:
         shutil.copy2(src, dst)
+        _scan_configs.cache_clear()
         log.info("Config imported: %s", dst)
         return dst.stem
     except Exception as e:
@@ -213,9 +308,8 @@ def import_config(src_path: str) -> str | None:
 
 def preset_to_config(preset: dict) -> dict:
     """Wrap a preset dict into a saveable config dict."""
-    import copy
     return {
         "name":   preset["name"],
         "layout": preset.get("layout", "qwerty"),
-        "keys":   copy.deepcopy(preset["keys"]),
+        "keys":   [k.copy() for k in preset["keys"]],
     }
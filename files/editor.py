@@ -9,13 +9,12 @@ Features:
   - Per-key colour, label, size, radius overrides
 """
 
-import copy
 import logging
 import uuid
 
-from PyQt6.QtCore import Qt, QRectF, QPointF, pyqtSignal
+from PyQt6.QtCore import Qt, QRectF, QPointF, QLineF, QTimer, pyqtSignal
 from PyQt6.QtGui import (QColor, QPainter, QPen, QBrush, QFont,
-                          QFontMetrics, QCursor)
+                          QFontMetrics, QCursor, QPixmap)
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QDoubleSpinBox, QSpinBox, QCheckBox, QColorDialog,
@@ -23,13 +22,16 @@ from PyQt6.QtWidgets import (
     QSplitter
 )
 
+from config import Theme
+from presets import Key
+
 log = logging.getLogger("editor")
 
-UNIT = 44
-GAP  = 4
-KH   = 44
 PAD  = 10
-GRID = 44
+
+
+def _clone_keys(keys: list) -> list:
+    return [k.copy() for k in keys]
 
 
 def _hex(color, fallback="#2a2a3a"):
@@ -44,19 +46,37 @@ def _hex(color, fallback="#2a2a3a"):
 class EditorCanvas(QWidget):
     """The main drag canvas for placing / moving keys."""
 
-    selection_changed = pyqtSignal(object)   # emits selected key dict or None
+    selection_changed = pyqtSignal(object)   # emits selected Key or None
+    key_moved         = pyqtSignal(object)   # emits the dragged Key
     layout_changed    = pyqtSignal()
 
-    def __init__(self, theme: dict, parent=None):
+    def __init__(self, theme: Theme, parent=None):
         super().__init__(parent)
         self._theme   = theme
         self._keys    = []
-        self._selected: dict | None = None
-        self._drag_key: dict | None = None
+        self._rects: list[QRectF] = []   # parallel to _keys
+        # id → every key using it; ids may repeat (the overlay lights them together)
+        self._by_id: dict[str, list[Key]] = {}
+        self._selected: Key | None = None
+        self._drag_key: Key | None = None
+        self._drag_idx = -1
+        self._drag_dirty: QRectF | None = None   # drag start rect since last flush
         self._drag_offset = QPointF(0, 0)
-        self._snap = theme.get("snap_to_grid", True)
-        self._grid = theme.get("grid_size", GRID)
-        self._show_grid = theme.get("grid_visible", True)
+        self._extent_x = self._extent_y = 0.0
+        self._snap = theme.snap_to_grid
+        self._grid = theme.grid_size
+        self._show_grid = theme.grid_visible
+        self._colors: dict[str, QColor] = {}   # per-key hex → QColor
+        self._sel_pen  = QPen(QColor("#ffffff"), 2)
+        self._grid_pen = QPen(QColor("#2a2a3a"), 1)
+        self._grid_pixmap: QPixmap | None = None   # bg + grid; rebuilt on resize / theme
+        self._cache_theme()
+
+        # Drag moves are coalesced so signals/repaints run at most once per frame
+        self._drag_timer = QTimer(self)
+        self._drag_timer.setSingleShot(True)
+        self._drag_timer.setInterval(16)
+        self._drag_timer.timeout.connect(self._flush_drag)
 
         self.setMinimumSize(900, 500)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -66,51 +86,101 @@ class EditorCanvas(QWidget):
 
     # ── Units → pixels ────────────────────────────────────────────────────────
 
-    def _unit(self):
-        return self._theme.get("key_unit_px", UNIT)
-
-    def _gap(self):
-        return self._theme.get("key_gap_px", GAP)
-
-    def _kh(self):
-        return self._theme.get("key_height_px", KH)
+    def _cache_theme(self):
+        """Resolve theme values used on every repaint — rebuilt in set_theme only."""
+        t = self._theme
+        self._geom = (
+            t.key_unit_px,
+            t.key_gap_px,
+            t.key_height_px,
+        )
+        self._rad = t.key_radius
+        self._bg_qc = QColor(t.bg)
+        self._idle_qc = _hex(t.key_idle)
+        self._outline_qc = _hex(t.key_outline)
+        self._text_qc = _hex(t.key_text)
+        self._outline_pen = QPen(self._outline_qc, 1)
+
+        self._font = QFont(t.font_family, t.font_size)
+        if t.font_bold:
+            self._font.setBold(True)
+        self._font_small = QFont(self._font)
+        self._font_small.setPointSize(max(6, t.font_size - 2))
+        self._grid_pixmap = None
+
+    def _color(self, color: str) -> QColor:
+        qc = self._colors.get(color)
+        if qc is None:
+            qc = self._colors[color] = _hex(color)
+        return qc
 
     def _key_rect(self, k) -> QRectF:
-        u = self._unit(); g = self._gap(); kh = self._kh()
-        px = PAD + k["x"] * (u + g)
-        py = PAD + k["y"] * (kh + g)
-        pw = k["w"] * u + (k["w"] - 1) * g
-        ph = k["h"] * kh + (k["h"] - 1) * g
+        u, g, kh = self._geom
+        px = PAD + k.x * (u + g)
+        py = PAD + k.y * (kh + g)
+        pw = k.w * u + (k.w - 1) * g
+        ph = k.h * kh + (k.h - 1) * g
         return QRectF(px, py, pw, ph)
 
     def _snap_pos(self, x, y):
         if not self._snap:
             return x, y
-        u = self._unit(); g = self._gap(); kh = self._kh()
+        u, g, kh = self._geom
         gx = u + g
         gy = kh + g
         sx = round(x / gx)
         sy = round(y / gy)
         return sx, sy
 
+    def _rebuild_rects(self):
+        self._rects = [self._key_rect(k) for k in self._keys]
+
+    def _update_rect(self, rect: QRectF):
+        """Repaint just around one key — the margin covers the selection outline."""
+        self.update(rect.adjusted(-4, -4, 4, 4).toAlignedRect())
+
+    def _index_of(self, k: Key) -> int:
+        for i, key in enumerate(self._keys):
+            if key is k:
+                return i
+        return -1
+
+    def _unregister(self, k: Key):
+        """Drop k from _by_id, keeping its id while other keys still use it."""
+        keys = self._by_id.get(k.id, [])
+        for i, key in enumerate(keys):
+            if key is k:
+                del keys[i]
+                break
+        if not keys:
+            self._by_id.pop(k.id, None)
+
     # ── Public API ────────────────────────────────────────────────────────────
 
     def load_keys(self, keys: list):
-        self._keys = copy.deepcopy(keys)
-        self._selected = None
+        self._keys = _clone_keys(keys)
+        self._by_id = {}
+        for k in self._keys:
+            self._by_id.setdefault(k.id, []).append(k)
+        self._rebuild_rects()
+        self._selected = self._drag_key = None
+        self._drag_idx = -1
         self.selection_changed.emit(None)
         self.update()
-        self._resize_to_fit()
+        self._recompute_extents()
         log.debug("EditorCanvas loaded %d keys", len(self._keys))
 
     def get_keys(self) -> list:
-        return copy.deepcopy(self._keys)
+        return _clone_keys(self._keys)
 
-    def set_theme(self, theme: dict):
+    def set_theme(self, theme: Theme):
         self._theme = theme
-        self._snap = theme.get("snap_to_grid", True)
-        self._grid = theme.get("grid_size", GRID)
-        self._show_grid = theme.get("grid_visible", True)
+        self._snap = theme.snap_to_grid
+        self._grid = theme.grid_size
+        self._show_grid = theme.grid_visible
+        self._cache_theme()
+        self._rebuild_rects()
+        self._recompute_extents()
         self.update()
 
     def set_snap(self, snap: bool):
@@ -119,101 +189,121 @@ class EditorCanvas(QWidget):
 
     def set_show_grid(self, show: bool):
         self._show_grid = show
+        self._grid_pixmap = None
         self.update()
 
     def add_key(self):
         new_id = f"key_{uuid.uuid4().hex[:6]}"
-        k = {
-            "id": new_id, "label": "New",
-            "x": 0.0, "y": 9.0, "w": 1.0, "h": 1.0,
-            "color": None, "text_color": None,
-        }
+        k = Key(new_id, "New", x=0.0, y=9.0)
         self._keys.append(k)
+        self._rects.append(self._key_rect(k))
+        self._by_id[new_id] = [k]
         self._selected = k
         self.selection_changed.emit(k)
         self.layout_changed.emit()
+        self._recompute_extents()
         self.update()
         log.info("Added new key: %s", new_id)
 
     def delete_selected(self):
         if self._selected is None:
             return
-        kid = self._selected["id"]
-        self._keys = [k for k in self._keys if k["id"] != kid]
-        self._selected = None
+        k = self._selected
+        kid = k.id
+        self._unregister(k)
+        i = self._index_of(k)
+        del self._keys[i]
+        del self._rects[i]
+        self._selected = self._drag_key = None
+        self._drag_idx = -1
         self.selection_changed.emit(None)
         self.layout_changed.emit()
+        self._recompute_extents()
         self.update()
         log.info("Deleted key: %s", kid)
 
     def update_selected(self, updates: dict):
-        if self._selected is None:
+        sel = self._selected
+        if sel is None:
             return
-        for key, val in updates.items():
-            self._selected[key] = val
+        new_id = updates.get("id", sel.id)
+        if new_id != sel.id:
+            self._unregister(sel)
+            shared = self._by_id.setdefault(new_id, [])
+            if shared:
+                log.info("Key id '%s' now shared by %d keys — they light together",
+                         new_id, len(shared) + 1)
+            shared.append(sel)
+        for field, val in updates.items():
+            setattr(sel, field, val)
+        if not updates.keys().isdisjoint(("x", "y", "w", "h")):
+            self._rects[self._index_of(sel)] = self._key_rect(sel)
         self.layout_changed.emit()
         self.update()
 
     # ── Paint ─────────────────────────────────────────────────────────────────
 
+    def _build_grid_lines(self) -> list[QLineF]:
+        u, g, kh = self._geom
+        gx = u + g; gy = kh + g
+        w, h = self.width(), self.height()
+        lines = [QLineF(PAD + xi * gx, 0, PAD + xi * gx, h) for xi in range(w // gx + 1)]
+        lines += [QLineF(0, PAD + yi * gy, w, PAD + yi * gy) for yi in range(h // gy + 1)]
+        return lines
+
+    def _build_grid_pixmap(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        pix = QPixmap(self.size() * dpr)
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(self._bg_qc)
+        gp = QPainter(pix)
+        gp.setRenderHint(QPainter.RenderHint.Antialiasing)
+        gp.setPen(self._grid_pen)
+        gp.drawLines(self._build_grid_lines())
+        gp.end()
+        return pix
+
+    def resizeEvent(self, event):
+        self._grid_pixmap = None
+        super().resizeEvent(event)
+
     def paintEvent(self, event):
-        t = self._theme
-        rad = t.get("key_radius", 6)
-        font = QFont(t.get("font_family", "Consolas"), t.get("font_size", 10))
-        if t.get("font_bold", True):
-            font.setBold(True)
+        rad = self._rad
+        idle_qc, text_qc = self._idle_qc, self._text_qc
+        font, font_small = self._font, self._font_small
 
         p = QPainter(self)
         p.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Background
-        p.fillRect(self.rect(), QColor(t.get("bg", "#111111")))
-
-        # Grid
+        # Background + grid — static until resize / theme change, so blit it
         if self._show_grid:
-            p.setPen(QPen(QColor("#2a2a3a"), 1))
-            u = self._unit(); g = self._gap(); kh = self._kh()
-            gx = u + g; gy = kh + g
-            for xi in range(0, self.width() // gx + 1):
-                x = PAD + xi * gx
-                p.drawLine(int(x), 0, int(x), self.height())
-            for yi in range(0, self.height() // gy + 1):
-                y = PAD + yi * gy
-                p.drawLine(0, int(y), self.width(), int(y))
-
-        # Keys
-        p.setFont(font)
-        for k in self._keys:
-            rect = self._key_rect(k)
-            selected = (k is self._selected)
-
-            if k.get("color"):
-                bg = _hex(k["color"])
-            else:
-                bg = _hex(t.get("key_idle", "#2a2a3a"))
-
-            if selected:
-                ol = QColor("#ffffff")
-                ol_w = 2
-            else:
-                ol = _hex(t.get("key_outline", "#444466"))
-                ol_w = 1
+            if self._grid_pixmap is None:
+                self._grid_pixmap = self._build_grid_pixmap()
+            p.drawPixmap(0, 0, self._grid_pixmap)
+        else:
+            p.fillRect(self.rect(), self._bg_qc)
 
+        # Keys — only those touching the dirty area (plus outline width)
+        clip = QRectF(event.rect()).adjusted(-2, -2, 2, 2)
+        p.setFont(font)
+        selected_key = self._selected
+        for k, rect in zip(self._keys, self._rects):
+            if not rect.intersects(clip):
+                continue
+            bg = self._color(k.color) if k.color else idle_qc
             p.setBrush(QBrush(bg))
-            p.setPen(QPen(ol, ol_w))
+            p.setPen(self._sel_pen if k is selected_key else self._outline_pen)
             p.drawRoundedRect(rect, rad, rad)
 
-            tc = _hex(k.get("text_color") or t.get("key_text", "#ffffff"))
+            tc = self._color(k.text_color) if k.text_color else text_qc
             p.setPen(QPen(tc))
-            draw_font = font
-            if len(k.get("label", "")) > 5:
-                sf = QFont(font)
-                sf.setPointSize(max(6, t.get("font_size", 10) - 2))
-                p.setFont(sf)
-                draw_font = sf
-            p.drawText(rect, Qt.AlignmentFlag.AlignCenter, k.get("label", k["id"]))
-            if draw_font is not font:
+            label = k.label
+            if len(label) > 5:
+                p.setFont(font_small)
+                p.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
                 p.setFont(font)
+            else:
+                p.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
 
         p.end()
 
@@ -222,48 +312,86 @@ class EditorCanvas(QWidget):
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             pos = event.position()
-            hit = self._key_at(pos)
+            i = self._index_at(pos)
+            hit = self._keys[i] if i >= 0 else None
+            prev = self._selected
+            changed = hit is not prev
+            self._selected = hit
             if hit:
-                self._selected = hit
                 self._drag_key = hit
-                rect = self._key_rect(hit)
+                self._drag_idx = i
+                rect = self._rects[i]
                 self._drag_offset = QPointF(pos.x() - rect.x(), pos.y() - rect.y())
+            if changed:
                 self.selection_changed.emit(hit)
-            else:
-                self._selected = None
-                self.selection_changed.emit(None)
-            self.update()
+                if prev is not None:
+                    j = self._index_of(prev)
+                    if j >= 0:
+                        self._update_rect(self._rects[j])
+                if hit:
+                    self._update_rect(self._rects[i])
 
     def mouseMoveEvent(self, event):
         if self._drag_key and event.buttons() & Qt.MouseButton.LeftButton:
             pos = event.position()
-            u = self._unit(); g = self._gap(); kh = self._kh()
+            u, g, kh = self._geom
             raw_x = (pos.x() - self._drag_offset.x() - PAD) / (u + g)
             raw_y = (pos.y() - self._drag_offset.y() - PAD) / (kh + g)
             sx, sy = self._snap_pos(raw_x, raw_y)
-            self._drag_key["x"] = max(0.0, float(sx) if self._snap else max(0.0, raw_x))
-            self._drag_key["y"] = max(0.0, float(sy) if self._snap else max(0.0, raw_y))
-            self.layout_changed.emit()
-            self.selection_changed.emit(self._drag_key)
-            self.update()
-            self._resize_to_fit()
+            self._drag_key.x = max(0.0, float(sx) if self._snap else max(0.0, raw_x))
+            self._drag_key.y = max(0.0, float(sy) if self._snap else max(0.0, raw_y))
+            if self._drag_dirty is None:
+                self._drag_dirty = self._rects[self._drag_idx]
+            self._rects[self._drag_idx] = self._key_rect(self._drag_key)
+            if not self._drag_timer.isActive():
+                self._drag_timer.start()
 
     def mouseReleaseEvent(self, event):
-        self._drag_key = None
+        if self._drag_timer.isActive():
+            self._drag_timer.stop()
+            self._flush_drag()
+        self._drag_key = self._drag_dirty = None
+        self._drag_idx = -1
 
-    def _key_at(self, pos: QPointF) -> dict | None:
-        for k in reversed(self._keys):
-            if self._key_rect(k).contains(pos):
-                return k
-        return None
-
-    def _resize_to_fit(self):
-        if not self._keys:
+    def _flush_drag(self):
+        self.layout_changed.emit()
+        if self._drag_key is None:
+            self.update()
+            return
+        rect = self._rects[self._drag_idx]
+        self.key_moved.emit(self._drag_key)
+        self._grow_extents(rect)
+        if self._drag_dirty is not None:
+            rect = rect.united(self._drag_dirty)
+            self._drag_dirty = None
+        self._update_rect(rect)
+
+    def _index_at(self, pos: QPointF) -> int:
+        rects = self._rects
+        for i in range(len(rects) - 1, -1, -1):
+            if rects[i].contains(pos):
+                return i
+        return -1
+
+    # Canvas extents: recomputed over all keys only when the key set changes;
+    # during a drag only the moved key can push them out, so update in O(1).
+
+    def _recompute_extents(self):
+        if not self._rects:
             return
-        u = self._unit(); g = self._gap(); kh = self._kh()
-        max_x = max(PAD + k["x"] * (u+g) + k["w"] * u + (k["w"]-1)*g for k in self._keys)
-        max_y = max(PAD + k["y"] * (kh+g) + k["h"] * kh + (k["h"]-1)*g for k in self._keys)
-        self.setMinimumSize(int(max_x) + PAD*4, int(max_y) + PAD*4)
+        self._extent_x = max(r.right() for r in self._rects)
+        self._extent_y = max(r.bottom() for r in self._rects)
+        self._apply_extents()
+
+    def _grow_extents(self, rect: QRectF):
+        rx, ry = rect.right(), rect.bottom()
+        if rx > self._extent_x or ry > self._extent_y:
+            self._extent_x = max(self._extent_x, rx)
+            self._extent_y = max(self._extent_y, ry)
+            self._apply_extents()
+
+    def _apply_extents(self):
+        self.setMinimumSize(int(self._extent_x) + PAD*4, int(self._extent_y) + PAD*4)
 
 
 # ── Properties panel ─────────────────────────────────────────────────────────
@@ -275,7 +403,7 @@ class KeyPropertiesPanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._key: dict | None = None
+        self._key: Key | None = None
         self._building = False
         self._build_ui()
 
@@ -331,27 +459,38 @@ class KeyPropertiesPanel(QWidget):
 
         self.setEnabled(False)
 
-    def load_key(self, k: dict | None):
+    def load_key(self, k: Key | None):
+        if k is self._key:
+            return
         self._key = k
         self._building = True
         if k is None:
             self._title.setText("No key selected")
             self.setEnabled(False)
         else:
-            self._title.setText(f"Key: {k['id']}")
+            self._title.setText(f"Key: {k.id}")
             self.setEnabled(True)
-            self._id.setText(k.get("id", ""))
-            self._label.setText(k.get("label", ""))
-            self._x.setValue(k.get("x", 0))
-            self._y.setValue(k.get("y", 0))
-            self._w.setValue(k.get("w", 1.0))
-            self._h.setValue(k.get("h", 1.0))
+            self._id.setText(k.id)
+            self._label.setText(k.label)
+            self._x.setValue(k.x)
+            self._y.setValue(k.y)
+            self._w.setValue(k.w)
+            self._h.setValue(k.h)
             self._update_color_buttons(k)
         self._building = False
 
+    def update_position(self, k: Key):
+        """Refresh only X/Y while the loaded key is being dragged."""
+        if k is not self._key:
+            return
+        self._building = True
+        self._x.setValue(k.x)
+        self._y.setValue(k.y)
+        self._building = False
+
     def _update_color_buttons(self, k):
-        c = k.get("color")
-        tc = k.get("text_color")
+        c = k.color
+        tc = k.text_color
         style = f"background:{c};" if c else ""
         self._col_btn.setStyleSheet(style)
         tstyle = f"background:{tc};" if tc else ""
@@ -373,25 +512,25 @@ class KeyPropertiesPanel(QWidget):
     def _pick_color(self):
         if self._key is None:
             return
-        c = QColorDialog.getColor(QColor(self._key.get("color") or "#2a2a3a"), self)
+        c = QColorDialog.getColor(QColor(self._key.color or "#2a2a3a"), self)
         if c.isValid():
-            self._key["color"] = c.name()
+            self._key.color = c.name()
             self._update_color_buttons(self._key)
             self.changed.emit({"color": c.name()})
 
     def _pick_text_color(self):
         if self._key is None:
             return
-        c = QColorDialog.getColor(QColor(self._key.get("text_color") or "#ffffff"), self)
+        c = QColorDialog.getColor(QColor(self._key.text_color or "#ffffff"), self)
         if c.isValid():
-            self._key["text_color"] = c.name()
+            self._key.text_color = c.name()
             self._update_color_buttons(self._key)
             self.changed.emit({"text_color": c.name()})
 
     def _clear_color(self, field):
         if self._key is None:
             return
-        self._key[field] = None
+        setattr(self._key, field, None)
         self._update_color_buttons(self._key)
         self.changed.emit({field: None})
 
@@ -401,7 +540,7 @@ class KeyPropertiesPanel(QWidget):
 class EditorTab(QWidget):
     layout_saved = pyqtSignal(list)   # emits key list when user clicks Save
 
-    def __init__(self, theme: dict, parent=None):
+    def __init__(self, theme: Theme, parent=None):
         super().__init__(parent)
         self._theme = theme
         self._build_ui()
@@ -413,9 +552,9 @@ class EditorTab(QWidget):
         # Toolbar
         toolbar = QHBoxLayout()
         self._snap_cb = QCheckBox("Snap to grid")
-        self._snap_cb.setChecked(self._theme.get("snap_to_grid", True))
+        self._snap_cb.setChecked(self._theme.snap_to_grid)
         self._grid_cb = QCheckBox("Show grid")
-        self._grid_cb.setChecked(self._theme.get("grid_visible", True))
+        self._grid_cb.setChecked(self._theme.grid_visible)
         btn_add = QPushButton("+ Add Key")
         btn_del = QPushButton("✕ Delete Key")
         btn_save = QPushButton("💾 Save Layout")
@@ -455,12 +594,13 @@ class EditorTab(QWidget):
         btn_del.clicked.connect(self.canvas.delete_selected)
         btn_save.clicked.connect(self._on_save)
         self.canvas.selection_changed.connect(self.props.load_key)
+        self.canvas.key_moved.connect(self.props.update_position)
         self.props.changed.connect(self.canvas.update_selected)
 
     def load_keys(self, keys: list):
         self.canvas.load_keys(keys)
 
-    def set_theme(self, theme: dict):
+    def set_theme(self, theme: Theme):
         self._theme = theme
         self.canvas.set_theme(theme)
 
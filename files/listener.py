@@ -1,8 +1,10 @@
 """
 listener.py — Shared pynput keyboard + mouse listener.
 
-Runs both listeners in daemon threads. Emits key_event(key_id, pressed)
-via a callback so the overlay can update without polling.
+Runs both listeners in daemon threads. Events are queued rather than
+dispatched in place, so pynput's threads never wait on the GUI: a callback
+wakes the consumer on the first event after a drain, and the consumer
+drains everything pending in one go.
 
 key_id conventions:
   - single printable char  → lowercase char  e.g. "a", "1", "["
@@ -11,18 +13,29 @@ key_id conventions:
 """
 
 import logging
+import threading
+from collections import deque
 from pynput import keyboard, mouse
 
 log = logging.getLogger("listener")
 
 
-def _normalize(key) -> str | None:
-    try:
-        c = key.char
-        if c:
-            return c.lower()
-    except AttributeError:
-        pass
+# Key.* members are enum singletons, so their ids are resolved once up front;
+# printable chars are lowercased on first sight and reused after that.
+_SPECIAL_IDS: dict = {k: k.name.lower() for k in keyboard.Key}
+_CHAR_IDS: dict[str, str] = {}
+_MOUSE_IDS: dict = {b: f"mouse_{b.name}" for b in mouse.Button}
+
+
+def _normalize(key, _special=_SPECIAL_IDS, _chars=_CHAR_IDS) -> str | None:
+    c = getattr(key, "char", None)
+    if c:
+        kid = _chars.get(c)
+        if kid is None:
+            kid = _chars[c] = c.lower()
+        return kid
+    if isinstance(key, keyboard.Key):
+        return _special[key]
     name = getattr(key, "name", None) or str(key)
     return name.lower()
 
@@ -30,14 +43,21 @@ def _normalize(key) -> str | None:
 class InputListener:
     """
     Usage:
-        listener = InputListener(callback=my_fn)
+        listener = InputListener(callback=wake_fn)
         listener.start()
+        ...
+        listener.drain(sink)    # on the consumer (GUI) thread
 
-    callback(key_id: str, pressed: bool) is called from background threads.
+    callback() is called from background threads when new events arrive;
+    drain(sink) then calls sink(key_id: str, pressed: bool) for each one.
     """
 
     def __init__(self, callback):
         self._cb = callback
+        self._q: deque[tuple[str, bool]] = deque(maxlen=2048)
+        self._lock = threading.Lock()
+        self._wake_pending = False   # a wake-up is sent and not yet drained
+        self._push = self._make_push()
         self._kb = None
         self._ms = None
         self._started = False
@@ -77,16 +97,52 @@ class InputListener:
                     log.warning("Error stopping listener: %s", e)
         log.info("Listeners stopped")
 
+    def drain(self, sink):
+        """Pass every queued event to sink(key_id, pressed), oldest first."""
+        with self._lock:
+            # Cleared before emptying, so anything pushed after this point
+            # sends a fresh wake-up rather than waiting on this drain
+            self._wake_pending = False
+        q = self._q
+        while q:
+            sink(*q.popleft())
+
+    # The keyboard and mouse threads both push. Only the first event after a
+    # drain wakes the consumer, which then drains until empty — later events
+    # ride along with that wake-up. The pending flag is tested and set under
+    # the lock; checking len(q) instead would let two producers racing onto
+    # an empty queue both see 2 and neither wake it.
+
+    def _make_push(self):
+        # Runs per input event on pynput's threads: the queue, its append and
+        # the wake callback are closed over to skip the self.* lookups.
+        # Held keys autorepeat as a stream of presses; `last` drops any event
+        # that repeats a key's current state before it reaches the queue.
+        append, wake, lock = self._q.append, self._cb, self._lock
+        last: dict[str, bool] = {}
+
+        def push(kid: str, pressed: bool):
+            if last.get(kid) is pressed:
+                return
+            last[kid] = pressed
+            with lock:
+                append((kid, pressed))
+                if self._wake_pending:
+                    return
+                self._wake_pending = True
+            wake()   # outside the lock — a GUI-thread callback drains in place
+        return push
+
     def _on_kb_press(self, key):
         kid = _normalize(key)
         if kid:
-            self._cb(kid, True)
+            self._push(kid, True)
 
     def _on_kb_release(self, key):
         kid = _normalize(key)
         if kid:
-            self._cb(kid, False)
+            self._push(kid, False)
 
-    def _on_click(self, x, y, button, pressed):
-        kid = f"mouse_{button.name}"
-        self._cb(kid, pressed)
+    def _on_click(self, x, y, button, pressed, _ids=_MOUSE_IDS):
+        kid = _ids.get(button) or f"mouse_{button.name}"
+        self._push(kid, pressed)
@@ -13,15 +13,17 @@ Run:
   python main.py
 """
 
-import copy
+import contextlib
 import logging
 import sys
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QObject, pyqtSlot
+from collections import deque
+from PyQt6.QtCore import (Qt, QThread, QTimer, pyqtSignal, QObject, pyqtSlot,
+                          QRunnable, QThreadPool)
 from PyQt6.QtGui import QFont, QColor, QIcon
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QWidget,
     QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QListWidget, QListWidgetItem, QSlider, QSpinBox,
+    QListWidget, QSlider, QSpinBox,
     QDoubleSpinBox, QCheckBox, QLineEdit, QGroupBox,
     QFormLayout, QColorDialog, QMessageBox, QInputDialog,
     QFileDialog, QSplitter, QScrollArea, QComboBox,
@@ -30,40 +32,111 @@ from PyQt6.QtWidgets import (
 
 from config   import (load_settings, save_settings, list_configs, load_config,
                        save_config, delete_config, rename_config, duplicate_config,
-                       export_config, import_config, preset_to_config, DEFAULT_THEME)
+                       export_config, import_config, preset_to_config, Theme)
 from presets  import BUILTIN_PRESETS
 from overlay  import OverlayWindow
 from editor   import EditorTab
 from listener import InputListener
 
+
+# ── Stylesheet ────────────────────────────────────────────────────────────────
+
+# Set once on the QApplication in main() so Qt parses it a single time
+# instead of per MainWindow construction.
+_MAIN_QSS = """
+QMainWindow, QWidget { background:#1e1e2e; color:#e0e0ff; }
+QTabWidget::pane { border:1px solid #444466; }
+QTabBar::tab { background:#2a2a3a; color:#aaaacc; padding:6px 14px; }
+QTabBar::tab:selected { background:#3a3a5a; color:#ffffff; }
+QPushButton {
+    background:#3a3a5a; color:#e0e0ff; border:1px solid #555577;
+    padding:4px 10px; border-radius:4px;
+}
+QPushButton:hover { background:#4a4a7a; }
+QPushButton:pressed { background:#7b68ee; }
+QListWidget { background:#161626; border:1px solid #333355; }
+QListWidget::item:selected { background:#3a3a6a; }
+QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {
+    background:#161626; border:1px solid #333355;
+    color:#e0e0ff; padding:2px 4px; border-radius:3px;
+}
+QGroupBox { border:1px solid #333355; border-radius:4px;
+            margin-top:8px; padding-top:4px; }
+QGroupBox::title { color:#aaaacc; }
+QCheckBox { color:#e0e0ff; }
+QLabel { color:#e0e0ff; }
+QScrollBar:vertical { background:#1a1a2a; width:10px; }
+QScrollBar::handle:vertical { background:#444466; border-radius:4px; }
+QSplitter::handle { background:#333355; }
+"""
+
+
 # ── Logging setup ─────────────────────────────────────────────────────────────
 
+_LEVEL_HTML = {
+    level: f'<span style="color:{color};">%s</span>'
+    for level, color in (
+        ("DEBUG",    "#888888"),
+        ("INFO",     "#aaddff"),
+        ("WARNING",  "#ffcc44"),
+        ("ERROR",    "#ff6666"),
+        ("CRITICAL", "#ff2222"),
+    )
+}
+_DEFAULT_HTML = '<span style="color:#ffffff;">%s</span>'
+
+
+class _LogBridge(QObject):
+    line = pyqtSignal(str)
+
+
 class QtLogHandler(logging.Handler):
-    """Pushes log records into a QTextEdit."""
+    """Pushes log records into a QTextEdit.
+
+    While the Log tab is hidden, records go to a bounded ring buffer and are
+    replayed when it is shown — nothing is laid out that nobody can see.
+
+    Records can come from worker threads (background saves), so they reach
+    the widget through a signal — direct on the GUI thread, queued from any
+    other."""
     def __init__(self, widget: QTextEdit):
         super().__init__()
         self._w = widget
+        self._visible = False
+        self._buf: deque[str] = deque(maxlen=500)
         fmt = logging.Formatter("[%(levelname)s] %(name)s — %(message)s")
         self.setFormatter(fmt)
+        self._bridge = _LogBridge()    # created on, and delivering to, the GUI thread
+        self._bridge.line.connect(self._show)
 
     def emit(self, record):
-        msg = self.format(record)
-        color = {
-            "DEBUG":    "#888888",
-            "INFO":     "#aaddff",
-            "WARNING":  "#ffcc44",
-            "ERROR":    "#ff6666",
-            "CRITICAL": "#ff2222",
-        }.get(record.levelname, "#ffffff")
-        html = f'<span style="color:{color};">{msg}</span>'
-        # Must run on main thread
+        self._bridge.line.emit(
+            _LEVEL_HTML.get(record.levelname, _DEFAULT_HTML) % self.format(record))
+
+    def _show(self, html: str):
+        if not self._visible:
+            self._buf.append(html)
+            return
         try:
             self._w.append(html)
         except RuntimeError:
             pass
 
+    def set_visible(self, visible: bool):
+        self._visible = visible
+        if not visible or not self._buf:
+            return
+        self._w.setUpdatesEnabled(False)
+        try:
+            while self._buf:
+                self._w.append(self._buf.popleft())
+        except RuntimeError:
+            pass
+        finally:
+            self._w.setUpdatesEnabled(True)
+
 
-def setup_logging(log_widget: QTextEdit):
+def setup_logging(log_widget: QTextEdit) -> QtLogHandler:
     root = logging.getLogger()
     root.setLevel(logging.DEBUG)
     # Console handler
@@ -75,6 +148,7 @@ def setup_logging(log_widget: QTextEdit):
     wh = QtLogHandler(log_widget)
     wh.setLevel(logging.DEBUG)
     root.addHandler(wh)
+    return wh
 
 
 log = logging.getLogger("main")
@@ -83,7 +157,31 @@ log = logging.getLogger("main")
 # ── Key event bridge (thread-safe) ────────────────────────────────────────────
 
 class KeyBridge(QObject):
-    key_event = pyqtSignal(str, bool)
+    events_pending = pyqtSignal()
+
+
+# ── Background settings save ──────────────────────────────────────────────────
+
+class _SaveWorker(QRunnable):
+    """Writes a settings snapshot off the GUI thread."""
+    def __init__(self, snapshot: dict):
+        super().__init__()
+        self._snapshot = snapshot
+
+    def run(self):
+        save_settings(self._snapshot)
+
+
+# ── Colour swatches ───────────────────────────────────────────────────────────
+
+# The app stylesheet styles every QPushButton, and Qt ignores palette colours
+# on stylesheet-styled buttons, so swatches need a per-button rule.
+_SWATCH_QSS = "background:%s;"
+
+
+def _set_swatch(btn: QPushButton, color: str):
+    btn.setStyleSheet(_SWATCH_QSS % color)
+    btn.setText(color)
 
 
 # ── Main window ───────────────────────────────────────────────────────────────
@@ -95,11 +193,34 @@ class MainWindow(QMainWindow):
         self.resize(960, 680)
 
         self._settings  = load_settings()
-        self._theme     = self._settings.get("theme", dict(DEFAULT_THEME))
+        self._theme: Theme = self._settings["theme"]
+        # Created on first show, then hidden/shown rather than rebuilt.
+        # Layout/theme changes made while it is hidden mark it dirty.
         self._overlay: OverlayWindow | None = None
-        self._current_keys: list = copy.deepcopy(BUILTIN_PRESETS[0]["keys"])
+        self._overlay_dirty = False
+        self._current_keys: list | tuple = BUILTIN_PRESETS[0]["keys"]
         self._current_name: str = BUILTIN_PRESETS[0]["name"]
 
+        # Settings writes are coalesced — sliders and spin boxes fire per tick
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(300)
+        self._save_timer.timeout.connect(self._save_settings_async)
+        # One worker thread, so snapshots are written in the order taken —
+        # an older one can never land on disk after a newer one
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+
+        # Key events are folded into one overlay repaint per frame (~60 FPS).
+        # A release whose press hasn't been painted yet waits one extra frame
+        # so quick taps still flash on screen.
+        self._pending: dict[str, bool] = {}
+        self._deferred: dict[str, bool] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self._flush_keys)
+
         # Log widget must exist before setup_logging
         self._log_widget = QTextEdit()
         self._log_widget.setReadOnly(True)
@@ -107,17 +228,26 @@ class MainWindow(QMainWindow):
             "background:#0a0a0a; color:#aaaaaa; font-family:Consolas; font-size:10px;"
         )
 
-        setup_logging(self._log_widget)
+        self._log_widget.document().setMaximumBlockCount(2000)
+        self._log_handler = setup_logging(self._log_widget)
         log.info("Application starting")
 
         # Key bridge for thread-safe overlay updates
         self._bridge = KeyBridge()
-        self._bridge.key_event.connect(self._on_key_event)
+        # Only emitted off the GUI thread (see _listener_cb) — queue explicitly
+        self._bridge.events_pending.connect(
+            self._drain_key_events, Qt.ConnectionType.QueuedConnection
+        )
 
         self._listener = InputListener(callback=self._listener_cb)
 
+        # Built on first visit to their tab — see _build_ui
+        self._editor: EditorTab | None = None
+        self._config_list: QListWidget | None = None
+        self._swatches: dict[str, QPushButton] = {}
+        self._theme_batch = False
+
         self._build_ui()
-        self._refresh_config_list()
 
         # Start listener
         try:
@@ -146,39 +276,29 @@ class MainWindow(QMainWindow):
         self._tabs = QTabWidget()
         vbox.addWidget(self._tabs)
 
-        self._tabs.addTab(self._build_overlay_tab(),  "🖥  Overlay")
-        self._tabs.addTab(self._build_presets_tab(),  "📋  Presets")
-        self._tabs.addTab(self._build_editor_tab(),   "✏️  Editor")
-        self._tabs.addTab(self._build_theme_tab(),    "🎨  Theme")
-        self._tabs.addTab(self._build_log_tab(),      "📜  Log")
-
-        # Apply dark theme to main window
-        self.setStyleSheet("""
-            QMainWindow, QWidget { background:#1e1e2e; color:#e0e0ff; }
-            QTabWidget::pane { border:1px solid #444466; }
-            QTabBar::tab { background:#2a2a3a; color:#aaaacc; padding:6px 14px; }
-            QTabBar::tab:selected { background:#3a3a5a; color:#ffffff; }
-            QPushButton {
-                background:#3a3a5a; color:#e0e0ff; border:1px solid #555577;
-                padding:4px 10px; border-radius:4px;
-            }
-            QPushButton:hover { background:#4a4a7a; }
-            QPushButton:pressed { background:#7b68ee; }
-            QListWidget { background:#161626; border:1px solid #333355; }
-            QListWidget::item:selected { background:#3a3a6a; }
-            QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {
-                background:#161626; border:1px solid #333355;
-                color:#e0e0ff; padding:2px 4px; border-radius:3px;
-            }
-            QGroupBox { border:1px solid #333355; border-radius:4px;
-                        margin-top:8px; padding-top:4px; }
-            QGroupBox::title { color:#aaaacc; }
-            QCheckBox { color:#e0e0ff; }
-            QLabel { color:#e0e0ff; }
-            QScrollBar:vertical { background:#1a1a2a; width:10px; }
-            QScrollBar::handle:vertical { background:#444466; border-radius:4px; }
-            QSplitter::handle { background:#333355; }
-        """)
+        # Only the start tab is built up front. The rest get an empty page
+        # that is filled on first visit — the editor in particular lays out
+        # every key, which is wasted work if it's never opened.
+        self._builders = {}
+        self._tabs.addTab(self._build_overlay_tab(),            "🖥  Overlay")
+        self._add_lazy_tab(self._build_presets_tab,             "📋  Presets")
+        self._add_lazy_tab(self._build_editor_tab,              "✏️  Editor")
+        self._add_lazy_tab(self._build_theme_tab,               "🎨  Theme")
+        self._log_idx = self._add_lazy_tab(self._build_log_tab, "📜  Log")
+        self._tabs.currentChanged.connect(self._on_tab_changed)
+
+    def _add_lazy_tab(self, build, label: str) -> int:
+        page = QWidget()
+        QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+        idx = self._tabs.addTab(page, label)
+        self._builders[idx] = build
+        return idx
+
+    def _on_tab_changed(self, idx: int):
+        build = self._builders.pop(idx, None)
+        if build is not None:
+            self._tabs.widget(idx).layout().addWidget(build())
+        self._log_handler.set_visible(idx == self._log_idx)
 
     # ── Overlay tab ───────────────────────────────────────────────────────────
 
@@ -212,9 +332,10 @@ class MainWindow(QMainWindow):
         alpha_layout = QHBoxLayout(alpha_box)
         self._alpha_slider = QSlider(Qt.Orientation.Horizontal)
         self._alpha_slider.setRange(20, 100)
-        self._alpha_slider.setValue(int(self._theme.get("overlay_alpha", 0.93) * 100))
+        self._alpha_slider.setValue(int(self._theme.overlay_alpha * 100))
         self._alpha_val = QLabel(f"{self._alpha_slider.value()}%")
-        self._alpha_slider.valueChanged.connect(self._on_alpha_changed)
+        self._alpha_slider.valueChanged.connect(self._on_alpha_preview)
+        self._alpha_slider.sliderReleased.connect(self._on_alpha_commit)
         alpha_layout.addWidget(self._alpha_slider)
         alpha_layout.addWidget(self._alpha_val)
         vbox.addWidget(alpha_box)
@@ -224,7 +345,8 @@ class MainWindow(QMainWindow):
         scale_layout = QHBoxLayout(scale_box)
         self._scale_spin = QSpinBox()
         self._scale_spin.setRange(20, 80)
-        self._scale_spin.setValue(self._theme.get("key_unit_px", 44))
+        self._scale_spin.setValue(self._theme.key_unit_px)
+        self._scale_spin.setKeyboardTracking(False)
         self._scale_spin.valueChanged.connect(self._on_scale_changed)
         scale_layout.addWidget(QLabel("1u ="))
         scale_layout.addWidget(self._scale_spin)
@@ -256,8 +378,7 @@ class MainWindow(QMainWindow):
         lv = QVBoxLayout(left)
         lv.addWidget(QLabel("Built-in Presets"))
         self._preset_list = QListWidget()
-        for p in BUILTIN_PRESETS:
-            self._preset_list.addItem(QListWidgetItem(p["name"]))
+        self._preset_list.addItems([p["name"] for p in BUILTIN_PRESETS])
         lv.addWidget(self._preset_list)
         btn_load_preset = QPushButton("Load Preset")
         btn_save_as     = QPushButton("Save as Config…")
@@ -270,6 +391,7 @@ class MainWindow(QMainWindow):
         rv = QVBoxLayout(right)
         rv.addWidget(QLabel("Saved Configs"))
         self._config_list = QListWidget()
+        self._refresh_config_list()
         rv.addWidget(self._config_list)
         btn_row = QHBoxLayout()
         btn_load_cfg  = QPushButton("Load")
@@ -308,6 +430,8 @@ class MainWindow(QMainWindow):
     # ── Theme tab ─────────────────────────────────────────────────────────────
 
     def _build_theme_tab(self):
+        # Initial values only — handlers read self._theme, which Reset replaces
+        t = self._theme
         w = QWidget()
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -321,15 +445,13 @@ class MainWindow(QMainWindow):
             lbl.setMinimumWidth(160)
             btn = QPushButton()
             btn.setFixedWidth(80)
-            val = self._theme.get(key, "#ffffff")
-            btn.setStyleSheet(f"background:{val};")
-            btn.setText(val)
+            self._swatches[key] = btn
+            _set_swatch(btn, getattr(t, key))
             def pick(checked=False, k=key, b=btn):
-                c = QColorDialog.getColor(QColor(self._theme.get(k, "#ffffff")), self)
-                if c.isValid():
-                    self._theme[k] = c.name()
-                    b.setStyleSheet(f"background:{c.name()};")
-                    b.setText(c.name())
+                c = QColorDialog.getColor(QColor(getattr(self._theme, k)), self)
+                if c.isValid() and c.name() != getattr(self._theme, k):
+                    setattr(self._theme, k, c.name())
+                    _set_swatch(b, c.name())
                     self._apply_theme()
             btn.clicked.connect(pick)
             row.addWidget(lbl)
@@ -355,11 +477,11 @@ class MainWindow(QMainWindow):
         # Font section
         font_grp = QGroupBox("Font")
         fgl = QFormLayout(font_grp)
-        self._font_family = QLineEdit(self._theme.get("font_family", "Consolas"))
+        self._font_family = QLineEdit(t.font_family)
         self._font_size   = QSpinBox(); self._font_size.setRange(6, 24)
-        self._font_size.setValue(self._theme.get("font_size", 10))
+        self._font_size.setValue(t.font_size)
         self._font_bold   = QCheckBox("Bold")
-        self._font_bold.setChecked(self._theme.get("font_bold", True))
+        self._font_bold.setChecked(t.font_bold)
         fgl.addRow("Family:", self._font_family)
         fgl.addRow("Size:",   self._font_size)
         fgl.addRow("",        self._font_bold)
@@ -373,23 +495,26 @@ class MainWindow(QMainWindow):
         ggl = QFormLayout(geom_grp)
 
         self._key_radius = QSpinBox(); self._key_radius.setRange(0, 22)
-        self._key_radius.setValue(self._theme.get("key_radius", 6))
+        self._key_radius.setValue(t.key_radius)
         self._key_radius.setToolTip("Corner rounding radius in pixels (0 = sharp corners)")
 
         self._key_unit   = QSpinBox(); self._key_unit.setRange(20, 80)
-        self._key_unit.setValue(self._theme.get("key_unit_px", 44))
+        self._key_unit.setValue(t.key_unit_px)
 
         self._key_height = QSpinBox(); self._key_height.setRange(20, 80)
-        self._key_height.setValue(self._theme.get("key_height_px", 44))
+        self._key_height.setValue(t.key_height_px)
 
         self._key_gap    = QSpinBox(); self._key_gap.setRange(0, 20)
-        self._key_gap.setValue(self._theme.get("key_gap_px", 4))
+        self._key_gap.setValue(t.key_gap_px)
 
         ggl.addRow("Corner Radius (px):", self._key_radius)
         ggl.addRow("Key Width 1u (px):",  self._key_unit)
         ggl.addRow("Key Height (px):",    self._key_height)
         ggl.addRow("Gap (px):",           self._key_gap)
 
+        # Typed values apply on Enter / focus-out, not per keystroke
+        for spin in (self._key_unit, self._key_height, self._key_gap):
+            spin.setKeyboardTracking(False)
         self._key_radius.valueChanged.connect(lambda v: self._set_theme("key_radius", v))
         self._key_unit.valueChanged.connect(lambda v: self._set_theme("key_unit_px", v))
         self._key_height.valueChanged.connect(lambda v: self._set_theme("key_height_px", v))
@@ -400,11 +525,11 @@ class MainWindow(QMainWindow):
         grid_grp = QGroupBox("Editor Grid")
         grl = QFormLayout(grid_grp)
         self._grid_size  = QSpinBox(); self._grid_size.setRange(10, 100)
-        self._grid_size.setValue(self._theme.get("grid_size", 44))
+        self._grid_size.setValue(t.grid_size)
         self._snap_default = QCheckBox("Snap by default")
-        self._snap_default.setChecked(self._theme.get("snap_to_grid", True))
+        self._snap_default.setChecked(t.snap_to_grid)
         self._grid_vis = QCheckBox("Show grid by default")
-        self._grid_vis.setChecked(self._theme.get("grid_visible", True))
+        self._grid_vis.setChecked(t.grid_visible)
         grl.addRow("Grid size (px):", self._grid_size)
         grl.addRow("", self._snap_default)
         grl.addRow("", self._grid_vis)
@@ -445,18 +570,17 @@ class MainWindow(QMainWindow):
             self._hide_overlay()
 
     def _show_overlay(self):
-        if self._overlay is not None:
-            try:
-                self._overlay.close()
-            except Exception:
-                pass
         try:
-            self._overlay = OverlayWindow(self._current_keys, self._theme)
+            if self._overlay is None:
+                self._overlay = OverlayWindow(self._current_keys, self._theme)
+                self._overlay.closed.connect(self._on_overlay_closed)
+            elif self._overlay_dirty:
+                self._overlay.load_keys(self._current_keys, self._theme)
+            self._overlay_dirty = False
             x = self._settings.get("overlay_x", 100)
             y = self._settings.get("overlay_y", 100)
             self._overlay.move(x, y)
             self._overlay.show()
-            self._overlay.closed.connect(self._on_overlay_closed)
             self._btn_toggle.setText("⏹ Hide Overlay")
             self._status_lbl.setText("Overlay: Visible ✓")
             log.info("Overlay shown")
@@ -468,37 +592,62 @@ class MainWindow(QMainWindow):
             pos = self._overlay.pos()
             self._settings["overlay_x"] = pos.x()
             self._settings["overlay_y"] = pos.y()
-            self._overlay.close()
-            self._overlay = None
+            self._overlay.hide()
         self._btn_toggle.setText("▶ Show Overlay")
         self._status_lbl.setText("Overlay: Hidden")
         log.info("Overlay hidden")
 
     def _on_overlay_closed(self):
-        self._overlay = None
         self._btn_toggle.setText("▶ Show Overlay")
         self._status_lbl.setText("Overlay: Hidden")
 
     # ── Key events ────────────────────────────────────────────────────────────
 
-    def _listener_cb(self, key_id: str, pressed: bool):
-        """Called from pynput thread — forward to main thread."""
-        self._bridge.key_event.emit(key_id, pressed)
+    def _listener_cb(self):
+        """Called from pynput thread — wake the main thread to drain events.
+        A listener that delivers on the GUI thread is drained in place."""
+        if QThread.currentThread() == self.thread():
+            self._drain_key_events()
+        else:
+            self._bridge.events_pending.emit()
+
+    @pyqtSlot()
+    def _drain_key_events(self):
+        self._listener.drain(self._on_key_event)
 
     @pyqtSlot(str, bool)
     def _on_key_event(self, key_id: str, pressed: bool):
+        if pressed:
+            self._deferred.pop(key_id, None)
+            self._pending[key_id] = True
+        elif self._pending.get(key_id):
+            self._deferred[key_id] = False
+        else:
+            self._pending[key_id] = False
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_keys(self):
+        pending, self._pending, self._deferred = self._pending, self._deferred, {}
+        if self._pending:
+            self._flush_timer.start()
         if self._overlay and self._overlay.isVisible():
-            self._overlay.update_key(key_id, pressed)
+            self._overlay.update_keys(pending)
 
     # ── Layout loading ────────────────────────────────────────────────────────
 
-    def _load_layout(self, keys: list, name: str):
-        self._current_keys = copy.deepcopy(keys)
+    def _load_layout(self, keys: list | tuple, name: str):
+        # Held by reference — the overlay only reads keys and the editor
+        # clones them on load, so built-in presets are never copied here
+        self._current_keys = keys
         self._current_name = name
         self._cur_name_lbl.setText(name)
-        self._editor.load_keys(self._current_keys)
+        if self._editor is not None:
+            self._editor.load_keys(self._current_keys)
         if self._overlay and self._overlay.isVisible():
             self._overlay.load_keys(self._current_keys)
+        elif self._overlay:
+            self._overlay_dirty = True
         log.info("Layout loaded: %s (%d keys)", name, len(keys))
 
     # ── Preset actions ────────────────────────────────────────────────────────
@@ -530,9 +679,18 @@ class MainWindow(QMainWindow):
     # ── Config actions ────────────────────────────────────────────────────────
 
     def _refresh_config_list(self):
-        self._config_list.clear()
-        for name in list_configs():
-            self._config_list.addItem(QListWidgetItem(name))
+        # One batched insert with repaints/signals held off until it's done
+        lw = self._config_list
+        if lw is None:
+            return   # presets tab not built yet — it fills the list itself
+        lw.setUpdatesEnabled(False)
+        lw.blockSignals(True)
+        try:
+            lw.clear()
+            lw.addItems(list_configs())
+        finally:
+            lw.blockSignals(False)
+            lw.setUpdatesEnabled(True)
         log.debug("Config list refreshed")
 
     def _selected_config_name(self) -> str | None:
@@ -547,8 +705,13 @@ class MainWindow(QMainWindow):
         data = load_config(name)
         if data:
             self._load_layout(data["keys"], name)
+            self._remember_config(name)
+
+    def _remember_config(self, name: str):
+        """Record name as last_config — only a change schedules a save."""
+        if self._settings.get("last_config") != name:
             self._settings["last_config"] = name
-            save_settings(self._settings)
+            self._save_timer.start()
 
     def _rename_config(self):
         name = self._selected_config_name()
@@ -608,31 +771,52 @@ class MainWindow(QMainWindow):
         if save_config(name, cfg):
             self._load_layout(keys, name)
             self._refresh_config_list()
-            self._settings["last_config"] = name
-            save_settings(self._settings)
+            self._remember_config(name)
 
     # ── Theme helpers ─────────────────────────────────────────────────────────
 
     def _set_theme(self, key: str, val):
-        self._theme[key] = val
+        if getattr(self._theme, key) == val:
+            return
+        setattr(self._theme, key, val)
         self._apply_theme()
 
+    @contextlib.contextmanager
+    def _batching_theme(self):
+        """Hold off _apply_theme inside the block, then run it once on exit."""
+        self._theme_batch = True
+        try:
+            yield
+        finally:
+            self._theme_batch = False
+            self._apply_theme()
+
     def _apply_theme(self):
+        if self._theme_batch:
+            return
         self._settings["theme"] = self._theme
-        save_settings(self._settings)
-        self._editor.set_theme(self._theme)
+        self._save_timer.start()
+        if self._editor is not None:
+            self._editor.set_theme(self._theme)
         if self._overlay and self._overlay.isVisible():
             self._overlay.set_theme(self._theme)
+        elif self._overlay:
+            self._overlay_dirty = True
 
-    def _on_alpha_changed(self, val: int):
+    def _on_alpha_preview(self, val: int):
+        """Live feedback while dragging — the full theme apply waits for release."""
         self._alpha_val.setText(f"{val}%")
-        self._theme["overlay_alpha"] = val / 100.0
         if self._overlay:
             self._overlay.setWindowOpacity(val / 100.0)
+        if not self._alpha_slider.isSliderDown():
+            self._on_alpha_commit()   # keyboard / wheel step, no release coming
+
+    def _on_alpha_commit(self):
+        self._theme.overlay_alpha = self._alpha_slider.value() / 100.0
         self._apply_theme()
 
     def _on_scale_changed(self, val: int):
-        self._theme["key_unit_px"] = val
+        self._theme.key_unit_px = val
         self._apply_theme()
 
     def _reset_theme(self):
@@ -641,10 +825,38 @@ class MainWindow(QMainWindow):
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            self._theme = dict(DEFAULT_THEME)
-            self._apply_theme()
+            with self._batching_theme():
+                self._theme = Theme()
+                self._sync_theme_controls()
             log.info("Theme reset to defaults")
-            QMessageBox.information(self, "Theme Reset", "Theme reset. Restart the app to refresh all controls.")
+            QMessageBox.information(self, "Theme Reset", "Theme reset to defaults.")
+
+    def _sync_theme_controls(self):
+        """Show the current theme in every control that exists. Each control
+        signal routes back through _set_theme, so call inside _batching_theme."""
+        t = self._theme
+        self._alpha_slider.setValue(round(t.overlay_alpha * 100))
+        self._scale_spin.setValue(t.key_unit_px)
+        if not self._swatches:
+            return   # theme tab not built yet — it reads the theme when it is
+        for key, btn in self._swatches.items():
+            _set_swatch(btn, getattr(t, key))
+        self._font_family.setText(t.font_family)
+        self._font_size.setValue(t.font_size)
+        self._font_bold.setChecked(t.font_bold)
+        self._key_radius.setValue(t.key_radius)
+        self._key_unit.setValue(t.key_unit_px)
+        self._key_height.setValue(t.key_height_px)
+        self._key_gap.setValue(t.key_gap_px)
+        self._grid_size.setValue(t.grid_size)
+        self._snap_default.setChecked(t.snap_to_grid)
+        self._grid_vis.setChecked(t.grid_visible)
+
+    def _save_settings_async(self):
+        # Snapshot on the GUI thread — the theme is mutated in place by the
+        # controls, so the worker must not see the live object.
+        snapshot = dict(self._settings, theme=self._theme.copy())
+        self._save_pool.start(_SaveWorker(snapshot))
 
     # ── Close ─────────────────────────────────────────────────────────────────
 
@@ -654,6 +866,11 @@ class MainWindow(QMainWindow):
             self._settings["overlay_x"] = pos.x()
             self._settings["overlay_y"] = pos.y()
         self._settings["theme"] = self._theme
+        self._save_timer.stop()
+        # Queued snapshots are superseded by the final save; one already
+        # running must finish first or it could land on disk after it
+        self._save_pool.clear()
+        self._save_pool.waitForDone()
         save_settings(self._settings)
         if self._listener:
             self._listener.stop()
@@ -666,6 +883,7 @@ class MainWindow(QMainWindow):
 def main():
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    app.setStyleSheet(_MAIN_QSS)
 
     # Base dark palette so Qt widgets don't flash white before CSS loads
     from PyQt6.QtGui import QPalette
@@ -6,36 +6,124 @@ Receives key events via update_key(key_id, pressed).
 """
 
 import logging
-from PyQt6.QtCore import Qt, QRectF, pyqtSignal, QPoint
-from PyQt6.QtGui import QColor, QPainter, QPen, QBrush, QFont, QFontMetrics
+import operator
+from dataclasses import dataclass
+from functools import lru_cache
+
+from PyQt6.QtCore import Qt, QRect, QRectF, QTimer, pyqtSignal, QPointF
+from PyQt6.QtGui import (QColor, QPainter, QPen, QBrush, QFont, QFontMetrics,
+                         QImage, QPixmap, QRegion)
 from PyQt6.QtWidgets import QWidget
 
+from config import Theme
+
 log = logging.getLogger("overlay")
 
-UNIT = 44   # fallback — overridden by theme
+PAD = 10   # px around the key block
+ATLAS_WIDTH = 2048   # device px — key images are packed into rows this wide
 
 
+# Themes and layouts reuse a handful of colours, so brushes and pens are
+# memoised per hex string. QBrush/QPen are implicitly shared and never
+# mutated after creation, so handing out one instance is safe.
+
+@lru_cache(maxsize=256)
 def _hex(color: str | None, fallback: str) -> QColor:
     if color:
-        try:
-            return QColor(color)
-        except Exception:
-            log.warning("Invalid colour '%s', using fallback", color)
+        c = QColor(color)
+        if c.isValid():
+            return c
+        log.warning("Invalid colour '%s', using fallback", color)
     return QColor(fallback)
 
 
+@lru_cache(maxsize=256)
+def _brush_for(color: str | None, fallback: str) -> QBrush:
+    return QBrush(_hex(color, fallback))
+
+
+@lru_cache(maxsize=256)
+def _pen_for(color: str | None, fallback: str, width: int = 1) -> QPen:
+    return QPen(_hex(color, fallback), width)
+
+
+def _key_geometry(keys: list, unit: float, gap: float, kh: float):
+    """Whole-pixel rect and damage bounds for every key, plus the right and
+    bottom edge of the block.
+
+    Column by column — each pass is a tight comprehension / map and the
+    extent falls out of the same lists. w·unit + (w-1)·gap == w·(unit+gap) - gap.
+    Edges are rounded rather than sizes, so gaps stay even between keys at
+    fractional positions.
+    """
+    col, row = unit + gap, kh + gap
+    ls = [round(PAD + k.x * col) for k in keys]
+    ts = [round(PAD + k.y * row) for k in keys]
+    rs = [round(PAD + k.x * col + k.w * col - gap) for k in keys]
+    bs = [round(PAD + k.y * row + k.h * row - gap) for k in keys]
+    ws = list(map(operator.sub, rs, ls))
+    hs = list(map(operator.sub, bs, ts))
+    rects = list(map(QRect, ls, ts, ws, hs))
+    # Grown by 1px for the antialiased outline
+    bounds = [r.adjusted(-1, -1, 1, 1) for r in rects]
+    return rects, bounds, max(rs, default=PAD), max(bs, default=PAD)
+
+
+# Theme fields by what a change to them invalidates (see set_theme); the rest
+# are overlay_alpha and editor-only settings.
+_GEOMETRY_FIELDS = frozenset({"key_unit_px", "key_gap_px", "key_height_px"})
+_STYLE_FIELDS = frozenset({
+    "key_idle", "key_pressed", "mouse_idle", "mouse_pressed", "key_text",
+    "key_outline", "font_family", "font_size", "font_bold", "key_radius",
+})
+
+
+@dataclass(slots=True)
+class _RKey:
+    """One key resolved for painting — rebuilt on layout / theme change."""
+    id: str
+    bit: int               # this id's bit in OverlayWindow._pressed_mask
+    rect: QRect
+    bounds: QRect          # whole-pixel damage area incl. outline
+    brush_idle: QBrush
+    brush_pressed: QBrush
+    pen_outline: QPen
+    pen_text: QPen
+    font: QFont
+    label: str             # already fitted to the rect, see _restyle
+    frag_idle: QPainter.PixmapFragment | None = None      # atlas slots,
+    frag_pressed: QPainter.PixmapFragment | None = None   # set by _bake_pixmaps
+
+
 class OverlayWindow(QWidget):
     closed = pyqtSignal()
 
-    def __init__(self, keys: list, theme: dict):
+    # Baked key images keyed by everything that affects their pixels, shared
+    # across rebuilds — identical keys (and layout reloads) reuse one pixmap.
+    # Pruned to the current layout's images after every bake.
+    _PIXMAP_CACHE: dict[tuple, QPixmap] = {}
+
+    def __init__(self, keys: list, theme: Theme):
         super().__init__()
-        self._keys   = keys      # list of key dicts
-        self._theme  = dict(theme)
-        self._pressed: set[str] = set()
-        self._drag_pos: QPoint | None = None
+        self._keys   = keys      # list of Key
+        self._theme  = theme.copy()
+        # Pressed state as a bitset, one bit per distinct key id in the layout
+        self._pressed_mask = 0
+        self._kid_to_idx: dict[str, int] = {}
+        self._drag_offset: QPointF | None = None   # press point, widget-local
+        self._render: list[_RKey] = []
+        self._rad = 0
+        self._dpr = 1.0   # device pixel ratio the key pixmaps were baked at
+        self._atlas = QPixmap()   # every key image of the layout, see _bake_pixmaps
+        self._backing = QImage()  # the finished frame; paintEvent only copies it
+        self._align = Qt.AlignmentFlag.AlignCenter
+        self._key_rects: dict[str, QRect] = {}   # key_id → area to repaint
+        self._geometry: list[tuple[QRect, QRect]] = []   # per key: rect, bounds
+        self._dirty: set[str] = set()            # changed since the last flush
+        self._flush_pending = False
 
         self._setup_window()
-        self._compute_geometry()
+        self._rebuild_cache()
         log.info("OverlayWindow created with %d keys", len(keys))
 
     # ── Window setup ──────────────────────────────────────────────────────────
@@ -50,150 +138,337 @@ class OverlayWindow(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
         self.setWindowTitle("Keyboard Overlay")
 
-        alpha = int(self._theme.get("overlay_alpha", 0.93) * 255)
-        self.setWindowOpacity(self._theme.get("overlay_alpha", 0.93))
-
-    def _compute_geometry(self):
-        """Work out the pixel size needed to fit all keys."""
-        t = self._theme
-        unit = t.get("key_unit_px", UNIT)
-        gap  = t.get("key_gap_px", 4)
-        kh   = t.get("key_height_px", UNIT)
-        PAD  = 10
-
-        max_x = max_y = 0
-        for k in self._keys:
-            rx = k["x"] * (unit + gap) + k["w"] * unit + (k["w"] - 1) * gap
-            ry = k["y"] * (kh + gap) + k["h"] * kh + (k["h"] - 1) * gap
-            max_x = max(max_x, rx)
-            max_y = max(max_y, ry)
-
-        w = int(max_x) + PAD * 2
-        h = int(max_y) + PAD * 2
-        self.setFixedSize(w, h)
-        log.debug("Overlay size: %dx%d", w, h)
+        self.setWindowOpacity(self._theme.overlay_alpha)
 
     # ── Public API ────────────────────────────────────────────────────────────
 
-    def load_keys(self, keys: list, theme: dict | None = None):
+    def load_keys(self, keys: list, theme: Theme | None = None):
         """Hot-swap layout without closing the window."""
         self._keys = keys
-        if theme:
-            self._theme = dict(theme)
-        self._setup_window()
-        self._compute_geometry()
+        if theme is not None:
+            self._swap_theme(theme)
+        self._rebuild_cache()
         self.update()
         log.info("Overlay layout reloaded (%d keys)", len(keys))
 
     def update_key(self, key_id: str, pressed: bool):
         """Called from main thread via Qt signal/slot or after() safe call."""
-        changed = False
-        if pressed and key_id not in self._pressed:
-            self._pressed.add(key_id)
-            changed = True
-        elif not pressed and key_id in self._pressed:
-            self._pressed.discard(key_id)
-            changed = True
-        if changed:
-            self.update()   # triggers paintEvent — Qt batches these efficiently
-
-    def set_theme(self, theme: dict):
-        self._theme = dict(theme)
-        self._setup_window()
-        self._compute_geometry()
+        i = self._kid_to_idx.get(key_id)
+        if i is None:
+            return   # not in this layout — nothing to draw
+        old = self._pressed_mask
+        self._pressed_mask = old | (1 << i) if pressed else old & ~(1 << i)
+        if self._pressed_mask != old:
+            self._mark_dirty((key_id,))
+
+    def update_keys(self, changes: dict[str, bool]):
+        """Apply a batch of key_id → pressed states with a single repaint."""
+        idx = self._kid_to_idx
+        down = up = 0
+        for key_id, pressed in changes.items():
+            i = idx.get(key_id)
+            if i is not None:
+                if pressed:
+                    down |= 1 << i
+                else:
+                    up |= 1 << i
+        old = self._pressed_mask
+        self._pressed_mask = (old | down) & ~up
+        flipped = old ^ self._pressed_mask
+        if flipped:
+            self._mark_dirty([k for k in changes if k in idx and (flipped >> idx[k]) & 1])
+
+    def _mark_dirty(self, key_ids):
+        # Every change in this event-loop pass is folded into one update()
+        self._dirty.update(key_ids)
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(0, self._flush_dirty)
+
+    def _flush_dirty(self):
+        self._flush_pending = False
+        dirty, self._dirty = self._dirty, set()
+        # Only the keys' own pixels change; ids not in the layout draw nothing
+        region = QRegion()
+        for key_id in dirty:
+            rect = self._key_rects.get(key_id)
+            if rect is not None:
+                region += rect
+        if not region.isEmpty():
+            self._repaint_backing(region)
+            self.update(region)
+
+    def set_theme(self, theme: Theme):
+        """Apply a theme, redoing only what the changed fields affect: opacity
+        alone is a window property, colours / font / radius need a rebake,
+        and only unit / gap / height move keys."""
+        changed = self._swap_theme(theme)
+        if changed & _GEOMETRY_FIELDS:
+            self._rebuild_cache()
+        elif changed & _STYLE_FIELDS:
+            self._restyle()
+        else:
+            return   # alpha and/or editor-only fields — nothing to repaint
         self.update()
 
-    # ── Painting ──────────────────────────────────────────────────────────────
+    def _swap_theme(self, theme: Theme) -> set[str]:
+        """Take a copy of theme, apply its opacity and drop cached images it
+        invalidates. Returns the names of the fields that changed."""
+        old, self._theme = self._theme, theme.copy()
+        changed = {f for f, v in self._theme.to_dict().items() if getattr(old, f) != v}
+        if "overlay_alpha" in changed:
+            self.setWindowOpacity(self._theme.overlay_alpha)
+        if changed & (_GEOMETRY_FIELDS | _STYLE_FIELDS):
+            self.clear_pixmap_cache()   # the old theme's images won't be asked for again
+        return changed
+
+    # ── Render cache ──────────────────────────────────────────────────────────
+
+    def _rebuild_cache(self):
+        """Resolve each key's rect, brushes, pens and label once per layout /
+        geometry change — paintEvent then only picks idle vs pressed. Also
+        sizes the window to fit."""
+        t = self._theme
+        unit = t.key_unit_px
+        gap  = t.key_gap_px
+        kh   = t.key_height_px
+
+        keys = self._keys
+        rects, bounds, right, bottom = _key_geometry(keys, unit, gap, kh)
+        w = right + PAD
+        h = bottom + PAD
+        self.setFixedSize(w, h)
+        log.debug("Overlay size: %dx%d", w, h)
 
-    def paintEvent(self, event):
+        key_rects = {}
+        for k, b in zip(keys, bounds):
+            prev = key_rects.get(k.id)
+            key_rects[k.id] = b if prev is None else prev.united(b)
+        self._geometry = list(zip(rects, bounds))
+        self._key_rects = key_rects
+
+        # Bit per distinct id; keys held across a reload stay lit if they
+        # still exist in the new layout
+        old_idx, mask = self._kid_to_idx, self._pressed_mask
+        self._kid_to_idx = {kid: i for i, kid in enumerate(key_rects)}
+        self._pressed_mask = 0
+        for kid, i in old_idx.items():
+            if (mask >> i) & 1 and kid in self._kid_to_idx:
+                self._pressed_mask |= 1 << self._kid_to_idx[kid]
+        self._restyle()
+
+    def _restyle(self):
+        """Resolve brushes, pens and fonts onto the current geometry and
+        rebake — everything a colour / font change touches."""
         t = self._theme
-        unit  = t.get("key_unit_px", UNIT)
-        gap   = t.get("key_gap_px", 4)
-        kh    = t.get("key_height_px", UNIT)
-        rad   = t.get("key_radius", 6)
-        PAD   = 10
-
-        font = QFont(
-            t.get("font_family", "Consolas"),
-            t.get("font_size", 10),
-        )
-        if t.get("font_bold", True):
+        outline       = _pen_for(t.key_outline, "#444466")
+        text          = _pen_for(t.key_text, "#ffffff")
+        key_idle      = _brush_for(t.key_idle, "#2a2a3a")
+        key_pressed   = _brush_for(t.key_pressed, "#7b68ee")
+        mouse_idle    = _brush_for(t.mouse_idle, "#1e3a5f")
+        mouse_pressed = _brush_for(t.mouse_pressed, "#1e90ff")
+
+        font = QFont(t.font_family, t.font_size)
+        if t.font_bold:
             font.setBold(True)
-
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setFont(font)
-
-        # Transparent background
-        painter.fillRect(self.rect(), QColor(0, 0, 0, 0))
-
-        for k in self._keys:
-            kid = k["id"]
-            pressed = kid in self._pressed
-            is_mouse = kid.startswith("mouse_")
-
+        small = QFont(font)    # labels too wide for the key drop a size or two
+        small.setPointSize(max(6, t.font_size - 2))
+        fm, fm_small = QFontMetrics(font), QFontMetrics(small)
+        fitted: dict[tuple[str, int], tuple[QFont, str]] = {}   # (label, width) → font, text
+
+        idx = self._kid_to_idx
+        render = []
+        for k, (rect, bounds) in zip(self._keys, self._geometry):
+            is_mouse = k.id.startswith("mouse_")
             # Colours — per-key override → theme
-            if pressed:
-                if is_mouse:
-                    bg_color = _hex(None, t.get("mouse_pressed", "#1e90ff"))
-                else:
-                    bg_color = _hex(k.get("color") and None, t.get("key_pressed", "#7b68ee"))
+            if k.color:
+                brush_idle = _brush_for(k.color, t.key_idle)
             else:
-                if k.get("color"):
-                    bg_color = _hex(k["color"], t.get("key_idle", "#2a2a3a"))
-                elif is_mouse:
-                    bg_color = _hex(None, t.get("mouse_idle", "#1e3a5f"))
+                brush_idle = mouse_idle if is_mouse else key_idle
+            pen_text = _pen_for(k.text_color, t.key_text) if k.text_color else text
+            # Base font if the label fits, else the small one, else elided
+            fit = fitted.get((k.label, rect.width()))
+            if fit is None:
+                avail = rect.width() - 4
+                if fm.horizontalAdvance(k.label) <= avail:
+                    fit = (font, k.label)
+                elif fm_small.horizontalAdvance(k.label) <= avail:
+                    fit = (small, k.label)
                 else:
-                    bg_color = _hex(None, t.get("key_idle", "#2a2a3a"))
+                    fit = (small, fm_small.elidedText(k.label, Qt.TextElideMode.ElideRight, avail))
+                fitted[(k.label, rect.width())] = fit
+            render.append(_RKey(k.id, 1 << idx[k.id], rect, bounds, brush_idle,
+                                mouse_pressed if is_mouse else key_pressed,
+                                outline, pen_text, *fit))
+        self._render = render
+        self._rad = t.key_radius
+        self._bake_pixmaps()
+
+    def _bake_pixmaps(self):
+        """Rasterise every key's idle and pressed look once. Antialiased
+        rounded rects and text are the expensive part of a frame, and a key
+        only ever shows one of these two images.
+
+        The distinct images are then packed into one atlas pixmap so a frame
+        is a single drawPixmapFragments call, with a fragment per key."""
+        self._dpr = dpr = self.devicePixelRatioF()
+        render = self._render
+
+        # Keys share a handful of pen / font objects (mouse keys and per-key
+        # text colours are the exceptions), so group by them and resolve the
+        # style half of each cache key once per group rather than per key
+        groups: dict[tuple[int, int, int], list[int]] = {}
+        for i, k in enumerate(render):
+            groups.setdefault((id(k.pen_outline), id(k.pen_text), id(k.font)), []).append(i)
+        fills: dict[int, int] = {}   # id(brush) → rgba, same idea for fills
+        pixes: list[tuple[QPixmap, QPixmap]] = [None] * len(render)
+        for idxs in groups.values():
+            k = render[idxs[0]]
+            style = (k.pen_outline.color().rgba(), k.pen_text.color().rgba(),
+                     k.font.key(), self._rad, dpr)
+            for i in idxs:
+                k = render[i]
+                pixes[i] = (self._pixmap_for(k, k.brush_idle, style, fills),
+                            self._pixmap_for(k, k.brush_pressed, style, fills))
+
+        # Shelf-pack in first-use order; slots are in device pixels
+        slots: dict[int, QRectF] = {}
+        images = []
+        x = y = shelf = width = 0
+        for pix in (p for pair in pixes for p in pair):
+            ck = pix.cacheKey()
+            if ck in slots:
+                continue
+            w, h = pix.width(), pix.height()
+            if x and x + w > ATLAS_WIDTH:
+                x, y, shelf = 0, y + shelf, 0
+            slots[ck] = QRectF(x, y, w, h)
+            images.append(pix)
+            x += w
+            shelf = max(shelf, h)
+            width = max(width, x)
+
+        atlas = QPixmap(max(width, 1), max(y + shelf, 1))
+        atlas.fill(Qt.GlobalColor.transparent)
+        p = QPainter(atlas)
+        p.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        for pix in images:
+            src = QRectF(0, 0, pix.width(), pix.height())
+            p.drawPixmap(slots[pix.cacheKey()], pix, src)   # 1:1 device-pixel copy
+        p.end()
+        self._atlas = atlas
+
+        # Keep only what this layout uses — anything else (earlier layouts,
+        # another scale) would otherwise pile up for the life of the process
+        cache = self._PIXMAP_CACHE
+        for key in [key for key, pix in cache.items() if pix.cacheKey() not in slots]:
+            del cache[key]
+
+        # A fragment is placed by its centre and scaled back to logical size
+        scale = 1 / dpr
+        for k, (idle, pressed) in zip(self._render, pixes):
+            k.frag_idle = self._fragment(k.bounds, slots[idle.cacheKey()], scale)
+            k.frag_pressed = self._fragment(k.bounds, slots[pressed.cacheKey()], scale)
+
+        self._backing = QImage(round(self.width() * dpr), round(self.height() * dpr),
+                               QImage.Format.Format_ARGB32_Premultiplied)
+        self._backing.setDevicePixelRatio(dpr)
+        self._repaint_backing()
+
+    @staticmethod
+    def _fragment(bounds: QRect, src: QRectF, scale: float) -> QPainter.PixmapFragment:
+        centre = QPointF(bounds.x() + src.width() * scale / 2,
+                         bounds.y() + src.height() * scale / 2)
+        return QPainter.PixmapFragment.create(centre, src, scale, scale)
+
+    @classmethod
+    def clear_pixmap_cache(cls):
+        cls._PIXMAP_CACHE.clear()
+
+    def _pixmap_for(self, k: _RKey, brush: QBrush, style: tuple,
+                    fills: dict[int, int]) -> QPixmap:
+        fill = fills.get(id(brush))
+        if fill is None:
+            fill = fills[id(brush)] = brush.color().rgba()
+        b = k.bounds    # whole-pixel, so the key rect is always b less 1px
+        key = (b.width(), b.height(), fill, k.label) + style
+        pix = self._PIXMAP_CACHE.get(key)
+        if pix is None:
+            pix = self._PIXMAP_CACHE[key] = self._bake(k, brush, style[-1])
+        return pix
+
+    def _bake(self, k: _RKey, brush: QBrush, dpr: float) -> QPixmap:
+        b = k.bounds
+        pix = QPixmap(round(b.width() * dpr), round(b.height() * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pix)
+        p.setRenderHints(QPainter.RenderHint.Antialiasing |
+                         QPainter.RenderHint.TextAntialiasing)
+        p.translate(-b.x(), -b.y())
+        p.setBrush(brush)
+        p.setPen(k.pen_outline)
+        p.drawRoundedRect(QRectF(k.rect), self._rad, self._rad)
+        p.setPen(k.pen_text)
+        p.setFont(k.font)
+        p.drawText(k.rect, self._align, k.label)
+        p.end()
+        return pix
 
-            outline_color = _hex(t.get("key_outline", "#444466"), "#444466")
-            if k.get("text_color"):
-                text_color = _hex(k["text_color"], t.get("key_text", "#ffffff"))
-            else:
-                text_color = _hex(None, t.get("key_text", "#ffffff"))
-
-            # Pixel rect
-            px = PAD + k["x"] * (unit + gap)
-            py = PAD + k["y"] * (kh + gap)
-            pw = k["w"] * unit + (k["w"] - 1) * gap
-            ph = k["h"] * kh + (k["h"] - 1) * gap
-
-            rect = QRectF(px, py, pw, ph)
-
-            # Draw background
-            painter.setBrush(QBrush(bg_color))
-            painter.setPen(QPen(outline_color, 1))
-            painter.drawRoundedRect(rect, rad, rad)
-
-            # Draw label
-            painter.setPen(QPen(text_color))
-            fm = QFontMetrics(font)
-            label = k.get("label", kid)
-            # Use smaller font if label is long
-            draw_font = font
-            if len(label) > 5:
-                small = QFont(font)
-                small.setPointSize(max(6, t.get("font_size", 10) - 2))
-                painter.setFont(small)
-                draw_font = small
-            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, label)
-            if draw_font is not font:
-                painter.setFont(font)
+    # ── Painting ──────────────────────────────────────────────────────────────
+
+    def _repaint_backing(self, region: QRegion | None = None):
+        """Redraw the keys inside region (everything if None) into the
+        backing image. Called when key state changes, not per paintEvent."""
+        p = QPainter(self._backing)
+        if region is not None:
+            p.setClipRegion(region)
+        # Clear first — antialiased edges would otherwise blend over the old look
+        p.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        p.fillRect(self.rect(), Qt.GlobalColor.transparent)
+        p.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+
+        # Pure blit of whole-pixel pixmaps — no render hints needed here; the
+        # antialiasing lives in the baked pixmaps (see _bake)
+        mask = self._pressed_mask
+        frags = [k.frag_pressed if mask & k.bit else k.frag_idle
+                 for k in self._render if region is None or region.intersects(k.bounds)]
+        if frags:
+            p.drawPixmapFragments(frags, self._atlas)
+        p.end()
 
+    def paintEvent(self, event):
+        if self.devicePixelRatioF() != self._dpr:
+            self._bake_pixmaps()   # moved to a screen with a different scale
+
+        # Window damage and key changes alike cost one copy of the damaged area.
+        # That copy is all the raster engine does per frame, so there's no
+        # OpenGL path — a QOpenGLWidget would add texture uploads and
+        # unreliable translucency on top-level windows for nothing.
+        painter = QPainter(self)
+        painter.setClipRegion(event.region())
+        painter.drawImage(0, 0, self._backing)
         painter.end()
 
     # ── Drag to move ──────────────────────────────────────────────────────────
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            self._drag_pos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+            # Frameless, so widget-local == offset from the window's top-left
+            self._drag_offset = event.position()
 
     def mouseMoveEvent(self, event):
-        if self._drag_pos and event.buttons() & Qt.MouseButton.LeftButton:
-            self.move(event.globalPosition().toPoint() - self._drag_pos)
+        if self._drag_offset is not None and event.buttons() & Qt.MouseButton.LeftButton:
+            self.move((event.globalPosition() - self._drag_offset).toPoint())
 
     def mouseReleaseEvent(self, event):
-        self._drag_pos = None
+        self._drag_offset = None
+
+    def hideEvent(self, event):
+        # Releases aren't delivered while hidden — don't show stale presses
+        self._pressed_mask = 0
+        self._repaint_backing()
+        super().hideEvent(event)
 
     def closeEvent(self, event):
         log.info("Overlay window closed")
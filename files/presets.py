@@ -1,11 +1,12 @@
 """
 presets.py — Built-in keyboard layout presets.
-Each preset is a dict with:
+Each preset is a read-only mapping with:
   - name: display name
   - layout: str layout variant (qwerty / azerty)
-  - keys: list of key dicts (see schema below)
+  - keys: tuple of Key objects (see schema below) — shared, so anything
+          that edits keys copies them first
 
-Key schema:
+Key schema (saved configs store the same fields as plain dicts):
   {
     "id":      str   — unique id used for pynput matching
     "label":   str   — display text
@@ -19,85 +20,158 @@ Key schema:
 """
 
 import logging
-log = logging.getLogger("presets")
-
-
-def _key(kid, label, x, y, w=1.0, h=1.0, color=None, text_color=None):
-    return {
-        "id": kid, "label": label,
-        "x": x, "y": y, "w": w, "h": h,
-        "color": color, "text_color": text_color,
-    }
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 
+log = logging.getLogger("presets")
 
-# ── QWERTY rows ───────────────────────────────────────────────────────────────
 
+@dataclass(slots=True)
+class Key:
+    """One key of a layout. Slotted — layouts are walked on every repaint."""
+    id: str
+    label: str = ""
+    x: float = 0.0
+    y: float = 0.0
+    w: float = 1.0
+    h: float = 1.0
+    color: str | None = None
+    text_color: str | None = None
+
+    @classmethod
+    def from_dict(cls, d: dict) -> "Key":
+        kid = d["id"]
+        return cls(kid, d.get("label", kid), d.get("x", 0.0), d.get("y", 0.0),
+                   d.get("w", 1.0), d.get("h", 1.0), d.get("color"), d.get("text_color"))
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id, "label": self.label,
+            "x": self.x, "y": self.y, "w": self.w, "h": self.h,
+            "color": self.color, "text_color": self.text_color,
+        }
+
+    def copy(self) -> "Key":
+        return Key(self.id, self.label, self.x, self.y, self.w, self.h,
+                   self.color, self.text_color)
+
+
+def _key(kid, label, x, y, w=1.0, h=1.0, color=None, text_color=None) -> Key:
+    return Key(kid, label, x, y, w, h, color, text_color)
+
+
+# ── Row definitions ───────────────────────────────────────────────────────────
+
+# Module-level so the layout factories iterate ready-made tuples instead of
+# rebuilding every row on each call. 1u runs are (id, label); the bottom rows
+# carry (id, label, x, y, w).
+
+_FKEY_ROW = (          # shared by QWERTY and AZERTY
+    ("esc","Esc"), ("f1","F1"), ("f2","F2"), ("f3","F3"), ("f4","F4"),
+    ("f5","F5"), ("f6","F6"), ("f7","F7"), ("f8","F8"),
+    ("f9","F9"), ("f10","F10"), ("f11","F11"), ("f12","F12"),
+    ("print_screen","Prt"), ("insert","Ins"), ("delete","Del"),
+)
+
+_QWERTY_ROW1 = (
+    ("`","`"), ("1","1"), ("2","2"), ("3","3"), ("4","4"), ("5","5"),
+    ("6","6"), ("7","7"), ("8","8"), ("9","9"), ("0","0"),
+    ("-","-"), ("=","="),
+)
+_QWERTY_ROW2 = (("q","Q"),("w","W"),("e","E"),("r","R"),("t","T"),
+                ("y","Y"),("u","U"),("i","I"),("o","O"),("p","P"),
+                ("[","["), ("]","]"))
+_QWERTY_ROW3 = (("a","A"),("s","S"),("d","D"),("f","F"),("g","G"),
+                ("h","H"),("j","J"),("k","K"),("l","L"),(";",";"),("'","'"))
+_QWERTY_ROW4 = (("z","Z"),("x","X"),("c","C"),("v","V"),("b","B"),
+                ("n","N"),("m","M"),(",",","),(".","."),("/","/"))
+_QWERTY_ROW5 = (
+    ("ctrl_l","Ctrl",0,5,1.25), ("cmd","Win",1.25,5,1.25),
+    ("alt_l","Alt",2.5,5,1.25),
+    ("space","Space",3.75,5,6.25),
+    ("alt_r","Alt",10.0,5,1.25), ("cmd_r","Win",11.25,5,1.25),
+    ("ctrl_r","Ctrl",12.5,5,1.25),
+)
+
+_AZERTY_ROW1 = (
+    ("sup2","²"), ("ampersand","&"), ("eacute","é"),
+    ("quotedbl",'"'), ("apostrophe","'"), ("parenleft","("),
+    ("minus","-"), ("egrave","è"), ("underscore","_"),
+    ("ccedilla","ç"), ("agrave","à"), ("parenright",")"),
+    ("equal","="),
+)
+_AZERTY_ROW2 = (("a","A"),("z","Z"),("e","E"),("r","R"),("t","T"),
+                ("y","Y"),("u","U"),("i","I"),("o","O"),("p","P"),
+                ("caret","^"), ("dollar","$"))
+_AZERTY_ROW3 = (("q","Q"),("s","S"),("d","D"),("f","F"),("g","G"),
+                ("h","H"),("j","J"),("k","K"),("l","L"),("m","M"),
+                ("ugrave","ù"))
+_AZERTY_ROW4 = (("w","W"),("x","X"),("c","C"),("v","V"),("b","B"),
+                ("n","N"),(",",","),(";",";"),(":",":"),("!","!"))
+_AZERTY_ROW5 = (
+    ("ctrl_l","Ctrl",0,5,1.25), ("cmd","Win",1.25,5,1.25),
+    ("alt_l","Alt",2.5,5,1.25),
+    ("space","Space",3.75,5,6.25),
+    ("alt_gr","AltGr",10.0,5,1.25), ("cmd_r","Win",11.25,5,1.25),
+    ("ctrl_r","Ctrl",12.5,5,1.25),
+)
+
+_NUMPAD_ROWS = (       # (id, label, col[, w]) per row
+    (("num_lock","Num",0), ("kp_divide","/",1), ("kp_multiply","*",2), ("kp_subtract","-",3)),
+    (("kp7","7",0), ("kp8","8",1), ("kp9","9",2)),
+    (("kp4","4",0), ("kp5","5",1), ("kp6","6",2)),
+    (("kp1","1",0), ("kp2","2",1), ("kp3","3",2)),
+    (("kp0","0",0, 2.0), ("kp_decimal",".",2)),
+)
+
+
+# ── QWERTY ────────────────────────────────────────────────────────────────────
+
+# Built once — the filtered QWERTY presets below are all cut from this list,
+# so callers must copy before mutating an entry.
+@lru_cache(maxsize=1)
 def _qwerty_full():
     keys = []
     # Row 0 – function keys
-    row0 = [
-        ("esc","Esc"), ("f1","F1"), ("f2","F2"), ("f3","F3"), ("f4","F4"),
-        ("f5","F5"), ("f6","F6"), ("f7","F7"), ("f8","F8"),
-        ("f9","F9"), ("f10","F10"), ("f11","F11"), ("f12","F12"),
-        ("print_screen","Prt"), ("insert","Ins"), ("delete","Del"),
-    ]
     x = 0
-    for kid, lbl in row0:
+    for kid, lbl in _FKEY_ROW:
         keys.append(_key(kid, lbl, x, 0))
         x += 1
 
     # Row 1 – numbers
-    row1 = [
-        ("`","`"), ("1","1"), ("2","2"), ("3","3"), ("4","4"), ("5","5"),
-        ("6","6"), ("7","7"), ("8","8"), ("9","9"), ("0","0"),
-        ("-","-"), ("=","="),
-    ]
     x = 0
-    for kid, lbl in row1:
+    for kid, lbl in _QWERTY_ROW1:
         keys.append(_key(kid, lbl, x, 1))
         x += 1
     keys.append(_key("backspace", "Bksp", x, 1, w=2.0))
 
     # Row 2 – QWERTY
     keys.append(_key("tab", "Tab", 0, 2, w=1.5))
-    row2 = [("q","Q"),("w","W"),("e","E"),("r","R"),("t","T"),
-            ("y","Y"),("u","U"),("i","I"),("o","O"),("p","P"),
-            ("[","["), ("]","]")]
     x = 1.5
-    for kid, lbl in row2:
+    for kid, lbl in _QWERTY_ROW2:
         keys.append(_key(kid, lbl, x, 2))
         x += 1
     keys.append(_key("\\", "\\", x, 2, w=1.5))
 
     # Row 3 – ASDF
     keys.append(_key("caps_lock", "Caps", 0, 3, w=1.75))
-    row3 = [("a","A"),("s","S"),("d","D"),("f","F"),("g","G"),
-            ("h","H"),("j","J"),("k","K"),("l","L"),(";",";"),(  "'","'")]
     x = 1.75
-    for kid, lbl in row3:
+    for kid, lbl in _QWERTY_ROW3:
         keys.append(_key(kid, lbl, x, 3))
         x += 1
     keys.append(_key("enter", "Enter", x, 3, w=2.25))
 
     # Row 4 – ZXCV
     keys.append(_key("shift", "Shift", 0, 4, w=2.25))
-    row4 = [("z","Z"),("x","X"),("c","C"),("v","V"),("b","B"),
-            ("n","N"),("m","M"),(",",","),(  ".","."),(  "/","/")]
     x = 2.25
-    for kid, lbl in row4:
+    for kid, lbl in _QWERTY_ROW4:
         keys.append(_key(kid, lbl, x, 4))
         x += 1
     keys.append(_key("shift_r", "Shift", x, 4, w=2.75))
 
     # Row 5 – bottom
-    row5 = [
-        ("ctrl_l","Ctrl",0,5,1.25), ("cmd","Win",1.25,5,1.25),
-        ("alt_l","Alt",2.5,5,1.25),
-        ("space","Space",3.75,5,6.25),
-        ("alt_r","Alt",10.0,5,1.25), ("cmd_r","Win",11.25,5,1.25),
-        ("ctrl_r","Ctrl",12.5,5,1.25),
-    ]
-    for kid, lbl, x, y, w in row5:
+    for kid, lbl, x, y, w in _QWERTY_ROW5:
         keys.append(_key(kid, lbl, x, y, w=w))
 
     # Mouse
@@ -109,7 +183,7 @@ def _qwerty_full():
 
 
 def _qwerty_no_fkeys():
-    return [k for k in _qwerty_full() if k["y"] != 0 or k["id"] in ("esc",)]
+    return [k.copy() for k in _qwerty_full() if k.y != 0 or k.id in ("esc",)]
 
 
 def _qwerty_left_half():
@@ -123,7 +197,7 @@ def _qwerty_left_half():
         "ctrl_l","cmd","alt_l","space",
         "mouse_left","mouse_middle","mouse_right",
     }
-    return [k for k in _qwerty_full() if k["id"] in keep_ids]
+    return [k.copy() for k in _qwerty_full() if k.id in keep_ids]
 
 
 def _gaming_wasd():
@@ -136,25 +210,18 @@ def _gaming_wasd():
         "ctrl_l","alt_l","space",
         "mouse_left","mouse_middle","mouse_right",
     }
-    keys = [k for k in _qwerty_full() if k["id"] in keep_ids]
+    keys = [k.copy() for k in _qwerty_full() if k.id in keep_ids]
     # Highlight WASD
     highlight = {"w","a","s","d"}
     for k in keys:
-        if k["id"] in highlight:
-            k["color"] = "#7b68ee"
+        if k.id in highlight:
+            k.color = "#7b68ee"
     return keys
 
 
 def _numpad():
     keys = []
-    layout = [
-        [("num_lock","Num",0), ("kp_divide","/",1), ("kp_multiply","*",2), ("kp_subtract","-",3)],
-        [("kp7","7",0), ("kp8","8",1), ("kp9","9",2)],
-        [("kp4","4",0), ("kp5","5",1), ("kp6","6",2)],
-        [("kp1","1",0), ("kp2","2",1), ("kp3","3",2)],
-        [("kp0","0",0, 2.0), ("kp_decimal",".",2)],
-    ]
-    for row_idx, row in enumerate(layout):
+    for row_idx, row in enumerate(_NUMPAD_ROWS):
         for item in row:
             if len(item) == 4:
                 kid, lbl, col, w = item
@@ -172,72 +239,44 @@ def _numpad():
 def _azerty_full():
     keys = []
     # Row 0 – function keys (same as QWERTY)
-    row0 = [
-        ("esc","Esc"), ("f1","F1"), ("f2","F2"), ("f3","F3"), ("f4","F4"),
-        ("f5","F5"), ("f6","F6"), ("f7","F7"), ("f8","F8"),
-        ("f9","F9"), ("f10","F10"), ("f11","F11"), ("f12","F12"),
-        ("print_screen","Prt"), ("insert","Ins"), ("delete","Del"),
-    ]
     x = 0
-    for kid, lbl in row0:
+    for kid, lbl in _FKEY_ROW:
         keys.append(_key(kid, lbl, x, 0))
         x += 1
 
     # Row 1 – AZERTY numbers
-    row1 = [
-        ("sup2","²"), ("ampersand","&"), ("eacute","é"),
-        ("quotedbl",'"'), ("apostrophe","'"), ("parenleft","("),
-        ("minus","-"), ("egrave","è"), ("underscore","_"),
-        ("ccedilla","ç"), ("agrave","à"), ("parenright",")"),
-        ("equal","="),
-    ]
     x = 0
-    for kid, lbl in row1:
+    for kid, lbl in _AZERTY_ROW1:
         keys.append(_key(kid, lbl, x, 1))
         x += 1
     keys.append(_key("backspace", "Bksp", x, 1, w=2.0))
 
     # Row 2 – AZERTY
     keys.append(_key("tab", "Tab", 0, 2, w=1.5))
-    row2 = [("a","A"),("z","Z"),("e","E"),("r","R"),("t","T"),
-            ("y","Y"),("u","U"),("i","I"),("o","O"),("p","P"),
-            ("caret","^"), ("dollar","$")]
     x = 1.5
-    for kid, lbl in row2:
+    for kid, lbl in _AZERTY_ROW2:
         keys.append(_key(kid, lbl, x, 2))
         x += 1
     keys.append(_key("\\", "\\", x, 2, w=1.5))
 
     # Row 3 – QSDF
     keys.append(_key("caps_lock", "Caps", 0, 3, w=1.75))
-    row3 = [("q","Q"),("s","S"),("d","D"),("f","F"),("g","G"),
-            ("h","H"),("j","J"),("k","K"),("l","L"),("m","M"),
-            ("ugrave","ù")]
     x = 1.75
-    for kid, lbl in row3:
+    for kid, lbl in _AZERTY_ROW3:
         keys.append(_key(kid, lbl, x, 3))
         x += 1
     keys.append(_key("enter", "Enter", x, 3, w=2.25))
 
     # Row 4 – WXCV
     keys.append(_key("shift", "Shift", 0, 4, w=2.25))
-    row4 = [("w","W"),("x","X"),("c","C"),("v","V"),("b","B"),
-            ("n","N"),(",",","),(";",";"),(":",":")  ,("!","!")]
     x = 2.25
-    for kid, lbl in row4:
+    for kid, lbl in _AZERTY_ROW4:
         keys.append(_key(kid, lbl, x, 4))
         x += 1
     keys.append(_key("shift_r", "Shift", x, 4, w=2.75))
 
     # Row 5
-    row5 = [
-        ("ctrl_l","Ctrl",0,5,1.25), ("cmd","Win",1.25,5,1.25),
-        ("alt_l","Alt",2.5,5,1.25),
-        ("space","Space",3.75,5,6.25),
-        ("alt_gr","AltGr",10.0,5,1.25), ("cmd_r","Win",11.25,5,1.25),
-        ("ctrl_r","Ctrl",12.5,5,1.25),
-    ]
-    for kid, lbl, x, y, w in row5:
+    for kid, lbl, x, y, w in _AZERTY_ROW5:
         keys.append(_key(kid, lbl, x, y, w=w))
 
     # Mouse
@@ -250,9 +289,8 @@ def _azerty_full():
 
 # ── Public registry ───────────────────────────────────────────────────────────
 
-BUILTIN_PRESETS = []
-
-def _register():
+def _register() -> tuple:
+    presets = []
     entries = [
         ("Full Keyboard (QWERTY)",   "qwerty", _qwerty_full),
         ("No F-Keys (QWERTY)",       "qwerty", _qwerty_no_fkeys),
@@ -263,10 +301,11 @@ def _register():
     ]
     for name, layout, fn in entries:
         try:
-            keys = fn()
-            BUILTIN_PRESETS.append({"name": name, "layout": layout, "keys": keys})
+            keys = tuple(fn())
+            presets.append(MappingProxyType({"name": name, "layout": layout, "keys": keys}))
             log.debug("Registered preset: %s (%d keys)", name, len(keys))
         except Exception as e:
             log.error("Failed to build preset '%s': %s", name, e)
+    return tuple(presets)
 
-_register()
+BUILTIN_PRESETS = _register()